@@ -15,6 +15,11 @@ from .transport.factory import TransportFactory
 
 _UNRESOLVED_VAR_PATTERN = re.compile(r"\$\{[^}]+\}")
 
+# Parsed YAML per resolved path, stamped with (st_mtime_ns, st_size).  Only the
+# raw parse is cached: env expansion and validation re-run on every load, and
+# _expand_env() hands callers fresh containers, never the cached tree.
+_YAML_CACHE: dict[str, tuple[tuple[int, int], Any]] = {}
+
 
 def _expand_env(value: Any) -> Any:
     """Recursively expand ${VAR} placeholders."""
@@ -59,10 +64,28 @@ def _resolve(key: str, entry: dict[str, Any], defaults: dict[str, Any]) -> str |
     return v if isinstance(v, str) and v.strip() else None
 
 
+def _parse_yaml(path: str | Path) -> Any:
+    """Return the parsed YAML at path, re-reading only when the file changed."""
+    file = Path(path)
+    st = file.stat()
+    stamp = (st.st_mtime_ns, st.st_size)
+    key = str(file.resolve())
+    cached = _YAML_CACHE.get(key)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+    data = yaml.safe_load(file.read_text(encoding="utf-8"))
+    _YAML_CACHE[key] = (stamp, data)
+    return data
+
+
+def clear_config_cache() -> None:
+    """Drop all cached YAML parses; the next load_config() re-reads from disk."""
+    _YAML_CACHE.clear()
+
+
 def load_config(path: str | Path) -> dict[str, Any]:
     """Load, expand env vars, and validate devices config YAML."""
-    raw = Path(path).read_text(encoding="utf-8")
-    data = yaml.safe_load(raw)
+    data = _parse_yaml(path)
     if data is None:
         raise ValueError(f"Empty config: {path}")
     if not isinstance(data, dict):
@@ -95,7 +95,11 @@ class ClientInterface(ABC):
 
     @abstractmethod
     def get_device_state(self) -> dict[str, Any]:
-        """Get current device state."""
+        """Get current device state.
+
+        Must return a fresh dict on every call — the runtime exposes it to
+        sinks through a read-only view without copying.
+        """
 
     @abstractmethod
     def get_group_state(self, group: "BlockGroup") -> dict[str, Any]:
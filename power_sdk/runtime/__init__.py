@@ -4,7 +4,7 @@ from .bridge import BridgeMapper
 from .config import SinkSpec
 from .device import DeviceRuntime, DeviceSnapshot
 from .factory import ResolvedPipeline, StageResolver
-from .loop import DeviceMetrics, Executor
+from .loop import DeviceMetrics, Executor, install_uvloop
 from .push import PushCallbackAdapter
 from .registry import DeviceSummary, RuntimeRegistry
 from .sink import CompositeSink, JsonlSink, MemorySink, Sink
@@ -33,4 +33,5 @@ __all__ = [
     # command support is implemented. See power_sdk/runtime/spec.py for details.
     "WritePolicySpec",
     "build_sinks_from_config",
+    "install_uvloop",
 ]
@@ -25,7 +25,8 @@ class BridgeMapper(Protocol):
     """Map a DeviceSnapshot to a flat key → value entity state dict.
 
     Implementations must be stateless — same snapshot always produces the
-    same output dict.  No I/O; no side effects.
+    same output dict.  No I/O; no side effects — ``snapshot.state`` is a
+    read-only mapping and must not be mutated.
     """
 
     def map_snapshot(self, snapshot: DeviceSnapshot) -> dict[str, Any]:
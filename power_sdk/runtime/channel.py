@@ -0,0 +1,221 @@
+"""SnapshotChannel — bounded per-device hand-off from producer to sink worker.
+
+One channel per device: the poll loop (or push adapter) is the only producer,
+the sink worker the only consumer, and both run on the event loop thread.
+That makes asyncio.Queue's getter/putter future bookkeeping unnecessary — a
+deque plus one asyncio.Event for wakeup is enough.  Channels feeding the same
+sink may share that Event, so a single worker can sleep on all of them.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from collections.abc import Callable
+from typing import TYPE_CHECKING
+
+from .device import DeviceSnapshot
+
+if TYPE_CHECKING:
+    from .loop import DeviceMetrics
+
+
+DROP_POLICIES = ("drop_oldest", "drop_new")
+
+
+class BurstPool:
+    """Overflow slots shared by several bounded SnapshotChannels.
+
+    A full channel borrows a slot instead of dropping, and gives it back once
+    its consumer has taken the channel back under ``maxsize`` — a short burst
+    on one device is absorbed without reserving headroom for every device.
+    """
+
+    __slots__ = ("free",)
+
+    def __init__(self, capacity: int) -> None:
+        self.free = max(capacity, 0)
+
+
+class SnapshotChannel:
+    """Bounded single-producer/single-consumer snapshot channel.
+
+    Not thread-safe: every method must be called on the event loop thread
+    (push adapters get there via call_soon_threadsafe).
+
+    The drop policy is fixed per channel, so ``put`` is bound once at
+    construction to the matching specialised method — the hot path carries no
+    policy branch.
+
+    Args:
+        metrics: DeviceMetrics whose ``dropped_snapshots`` counts discards.
+        maxsize: Capacity; ``<= 0`` means unbounded (as with asyncio.Queue).
+        drop_policy: ``"drop_oldest"`` (evict the head to make room) or
+            ``"drop_new"`` (discard the incoming snapshot when full).
+        ready: Wakeup event to signal on put()/close(); pass the same Event
+            to every channel one consumer drains.  Defaults to a private one.
+        burst: Shared BurstPool a full bounded channel borrows from before
+            it drops anything.
+    """
+
+    __slots__ = (
+        "_borrowed",
+        "_burst",
+        "_closed",
+        "_items",
+        "_maxsize",
+        "_metrics",
+        "_ready",
+        "put",
+    )
+
+    put: Callable[[DeviceSnapshot], None]
+    """Append a snapshot without blocking, dropping per the channel policy."""
+
+    def __init__(
+        self,
+        metrics: DeviceMetrics,
+        maxsize: int = 0,
+        drop_policy: str = "drop_oldest",
+        *,
+        ready: asyncio.Event | None = None,
+        burst: BurstPool | None = None,
+    ) -> None:
+        if drop_policy not in DROP_POLICIES:
+            raise ValueError(
+                f"Invalid drop_policy={drop_policy!r}; must be one of {DROP_POLICIES}"
+            )
+        self._metrics = metrics
+        self._maxsize = maxsize if maxsize > 0 else 0
+        use_burst = burst is not None and bool(self._maxsize)
+        self._burst = burst if burst is not None else BurstPool(0)
+        self._borrowed = 0
+        # With a burst pool the deque may grow past maxsize, so the bound is
+        # enforced by hand rather than by deque maxlen.
+        self._items: deque[DeviceSnapshot] = deque(
+            maxlen=None if use_burst else (self._maxsize or None)
+        )
+        self._ready = ready if ready is not None else asyncio.Event()
+        self._closed = False
+        if not self._maxsize:
+            self.put = self._put_unbounded
+        elif use_burst:
+            self.put = (
+                self._put_burst_drop_oldest
+                if drop_policy == "drop_oldest"
+                else self._put_burst_drop_new
+            )
+        elif drop_policy == "drop_oldest":
+            self.put = self._put_drop_oldest
+        else:
+            self.put = self._put_drop_new
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    @property
+    def closed(self) -> bool:
+        """True once close() was called (items may still be queued)."""
+        return self._closed
+
+    def full(self) -> bool:
+        """True when the next put() has to drop a snapshot."""
+        if not self._maxsize or len(self._items) < self._maxsize + self._borrowed:
+            return False
+        return not self._burst.free
+
+    def _put_unbounded(self, snapshot: DeviceSnapshot) -> None:
+        self._items.append(snapshot)
+        self._ready.set()
+
+    def _put_drop_oldest(self, snapshot: DeviceSnapshot) -> None:
+        items = self._items
+        if len(items) == self._maxsize:
+            self._metrics.dropped_snapshots += 1  # deque maxlen evicts the head
+        items.append(snapshot)
+        self._ready.set()
+
+    def _put_drop_new(self, snapshot: DeviceSnapshot) -> None:
+        items = self._items
+        if len(items) == self._maxsize:
+            self._metrics.dropped_snapshots += 1
+            return
+        items.append(snapshot)
+        self._ready.set()
+
+    def _put_burst_drop_oldest(self, snapshot: DeviceSnapshot) -> None:
+        items = self._items
+        if len(items) >= self._maxsize + self._borrowed:
+            burst = self._burst
+            if burst.free:
+                burst.free -= 1
+                self._borrowed += 1
+            else:
+                items.popleft()
+                self._metrics.dropped_snapshots += 1
+        items.append(snapshot)
+        self._ready.set()
+
+    def _put_burst_drop_new(self, snapshot: DeviceSnapshot) -> None:
+        items = self._items
+        if len(items) >= self._maxsize + self._borrowed:
+            burst = self._burst
+            if not burst.free:
+                self._metrics.dropped_snapshots += 1
+                return
+            burst.free -= 1
+            self._borrowed += 1
+        items.append(snapshot)
+        self._ready.set()
+
+    def _release(self) -> None:
+        """Return borrowed burst slots no longer needed after a take."""
+        surplus = self._borrowed - max(len(self._items) - self._maxsize, 0)
+        if surplus > 0:
+            self._borrowed -= surplus
+            self._burst.free += surplus
+
+    def close(self) -> None:
+        """Mark end of stream; the consumer drains what is left, then stops."""
+        self._closed = True
+        self._ready.set()
+
+    def drain_all(self) -> list[DeviceSnapshot]:
+        """Remove and return every queued snapshot (oldest first)."""
+        items = list(self._items)
+        self._items.clear()
+        if self._borrowed:
+            self._release()
+        return items
+
+    def take(self, limit: int) -> list[DeviceSnapshot]:
+        """Remove and return up to *limit* queued snapshots without waiting."""
+        items = self._items
+        if not items:
+            return []
+        if len(items) <= limit:
+            return self.drain_all()
+        taken = [items.popleft() for _ in range(limit)]
+        if self._borrowed:
+            self._release()
+        return taken
+
+    async def wait(self) -> None:
+        """Sleep until the next put() or close() on any channel sharing the event.
+
+        Only the consumer may call this, and only after finding every channel
+        it drains empty — clearing the shared event is then race-free.
+        """
+        self._ready.clear()
+        await self._ready.wait()
+
+    async def get_batch(self, limit: int) -> list[DeviceSnapshot]:
+        """Wait for snapshots and return up to *limit* of them, oldest first.
+
+        Returns an empty list once the channel is closed and fully drained.
+        """
+        while not self._items:
+            if self._closed:
+                return []
+            await self.wait()
+        return self.take(limit)
@@ -13,6 +13,7 @@ the base structure. Adds:
 from __future__ import annotations
 
 import warnings
+from collections.abc import Callable
 from dataclasses import dataclass, field
 from pathlib import Path as _Path
 from typing import Any
@@ -20,8 +21,6 @@ from typing import Any
 from ..models.types import BlockGroup
 from .spec import VALID_MODES, PipelineSpec, WritePolicySpec
 
-_SINK_TYPES = frozenset({"composite", "jsonl", "memory"})
-
 # Upper bound for memory sink ring-buffer size.  A deque with 100 000 entries
 # holding typical IoT telemetry dicts (~1 KB each) would consume ~100 MB of
 # heap; larger values risk OOM in constrained environments.
@@ -44,6 +43,55 @@ class SinkSpec:
     sub_sinks: list[str] = field(default_factory=list)  # composite: child names
 
 
+def _parse_memory_fields(name: str, raw: dict[str, Any]) -> dict[str, Any]:
+    maxlen = raw.get("maxlen", 100)
+    if not isinstance(maxlen, int) or maxlen <= 0:
+        raise ValueError(
+            f"sinks.{name!r}.maxlen must be a positive integer, got {maxlen!r}"
+        )
+    if maxlen > _MAX_SINK_MAXLEN:
+        raise ValueError(
+            f"sinks.{name!r}.maxlen={maxlen} exceeds maximum {_MAX_SINK_MAXLEN}"
+        )
+    return {"maxlen": maxlen}
+
+
+def _parse_jsonl_fields(name: str, raw: dict[str, Any]) -> dict[str, Any]:
+    path = raw.get("path", "")
+    if not isinstance(path, str) or not path.strip():
+        raise ValueError(f"sinks.{name!r}.path must be a non-empty string")
+    # Reject paths containing '..' components to prevent directory traversal.
+    # Absolute paths (e.g. /var/log/device.jsonl) are explicitly permitted.
+    if ".." in _Path(path).parts:
+        raise ValueError(
+            f"sinks.{name!r}.path must not contain '..' components: {path!r}"
+        )
+    return {"path": path.strip()}
+
+
+def _parse_composite_fields(name: str, raw: dict[str, Any]) -> dict[str, Any]:
+    sub = raw.get("sinks", [])
+    if not isinstance(sub, list) or not sub:
+        raise ValueError(
+            f"sinks.{name!r}.sinks must be a non-empty list of sink names"
+        )
+    # YAML almost always yields strings already: copy without per-item str().
+    # A copy (not the raw list itself) so the spec never aliases the config.
+    if all(type(n) is str for n in sub):
+        return {"sub_sinks": list(sub)}
+    return {"sub_sinks": [str(n) for n in sub]}
+
+
+# Per-type field parsers: each validates the raw mapping and returns the
+# type-specific SinkSpec kwargs.  Also the single source of valid sink types.
+_SINK_FIELD_PARSERS: dict[str, Callable[[str, dict[str, Any]], dict[str, Any]]] = {
+    "memory": _parse_memory_fields,
+    "jsonl": _parse_jsonl_fields,
+    "composite": _parse_composite_fields,
+}
+_SINK_TYPES = frozenset(_SINK_FIELD_PARSERS)
+
+
 def parse_sink_specs(sinks_config: dict[str, Any]) -> dict[str, SinkSpec]:
     """Parse raw 'sinks' YAML section into {name: SinkSpec}.
 
@@ -58,70 +106,108 @@ def parse_sink_specs(sinks_config: dict[str, Any]) -> dict[str, SinkSpec]:
                 f"sinks.{name!r} must be a mapping, got {type(raw).__name__}"
             )
         sink_type = raw.get("type")
-        if sink_type not in _SINK_TYPES:
+        if not isinstance(sink_type, str) or sink_type not in _SINK_FIELD_PARSERS:
             raise ValueError(
                 f"sinks.{name!r}.type={sink_type!r} is invalid; "
                 f"expected one of {sorted(_SINK_TYPES)}"
             )
-        spec = SinkSpec(name=name, type=sink_type)
-        if sink_type == "memory":
-            maxlen = raw.get("maxlen", 100)
-            if not isinstance(maxlen, int) or maxlen <= 0:
-                raise ValueError(
-                    f"sinks.{name!r}.maxlen must be a positive integer, got {maxlen!r}"
-                )
-            if maxlen > _MAX_SINK_MAXLEN:
-                raise ValueError(
-                    f"sinks.{name!r}.maxlen={maxlen} exceeds maximum {_MAX_SINK_MAXLEN}"
-                )
-            spec.maxlen = maxlen
-        elif sink_type == "jsonl":
-            path = raw.get("path", "")
-            if not isinstance(path, str) or not path.strip():
-                raise ValueError(f"sinks.{name!r}.path must be a non-empty string")
-            # Reject paths containing '..' components to prevent directory traversal.
-            # Absolute paths (e.g. /var/log/device.jsonl) are explicitly permitted.
-            if ".." in _Path(path).parts:
-                raise ValueError(
-                    f"sinks.{name!r}.path must not contain '..' components: {path!r}"
-                )
-            spec.path = path.strip()
-        elif sink_type == "composite":
-            sub = raw.get("sinks", [])
-            if not isinstance(sub, list) or not sub:
-                raise ValueError(
-                    f"sinks.{name!r}.sinks must be a non-empty list of sink names"
-                )
-            spec.sub_sinks = [str(n) for n in sub]
-        specs[name] = spec
+        extra = _SINK_FIELD_PARSERS[sink_type](name, raw)
+        specs[name] = SinkSpec(name=name, type=sink_type, **extra)
     return specs
 
 
 _MAX_CYCLE_DEPTH = 50
 
 
-def _detect_cycle(
-    name: str,
-    specs: dict[str, SinkSpec],
-    path: tuple[str, ...] = (),
-    depth: int = 0,
-) -> None:
-    """Raise ValueError if composite sink references form a cycle.
+def _cycle_path(
+    start: str, members: set[str], edges: dict[str, list[str]]
+) -> list[str]:
+    """Return a shortest reference path from *start* back to itself.
 
-    The depth limit guards against adversarial configs with deeply nested
-    composite sinks that would otherwise cause a RecursionError.
+    Breadth-first search over edges restricted to one strongly connected
+    component, so every consecutive pair in the result is a real reference.
+    The closing edge back to *start* is implied.
     """
-    if depth > _MAX_CYCLE_DEPTH:
-        raise ValueError(
-            f"Composite sink nesting depth exceeds {_MAX_CYCLE_DEPTH}"
-        )
-    if name in path:
-        cycle = " -> ".join((*path, name))
-        raise ValueError(f"Cycle detected in composite sinks: {cycle}")
-    if name not in specs or specs[name].type != "composite":
-        return
-    for sub in specs[name].sub_sinks:
-        _detect_cycle(sub, specs, (*path, name), depth=depth + 1)
+    parent: dict[str, str] = {}
+    queue = [start]
+    for node in queue:
+        for nxt in edges.get(node, ()):
+            if nxt == start:
+                path = [node]
+                while node != start:
+                    node = parent[node]
+                    path.append(node)
+                path.reverse()
+                return path
+            if nxt in members and nxt not in parent:
+                parent[nxt] = node
+                queue.append(nxt)
+    return [start]  # unreachable for a genuine cycle
+
+
+def _find_sink_cycles(specs: dict[str, SinkSpec]) -> list[list[str]]:
+    """Return every cycle in the composite sink reference graph.
+
+    Iterative Tarjan SCC over composite -> sub-sink edges, O(V + E) for the
+    whole graph.  Each strongly connected component with more than one member,
+    or a single member that references itself, yields one cycle: the shortest
+    reference path from its first-discovered member back to itself.
+    References to unknown sinks are ignored here (they are reported
+    separately).
+
+    The depth limit rejects adversarially deep composite nesting, which would
+    otherwise overflow the recursive build in sink_factory.
+    """
+    edges = {
+        name: [sub for sub in spec.sub_sinks if sub in specs]
+        for name, spec in specs.items()
+        if spec.type == "composite"
+    }
+    index: dict[str, int] = {}
+    lowlink: dict[str, int] = {}
+    stack: list[str] = []
+    on_stack: set[str] = set()
+    cycles: list[list[str]] = []
+
+    for root in edges:
+        if root in index:
+            continue
+        index[root] = lowlink[root] = len(index)
+        stack.append(root)
+        on_stack.add(root)
+        work = [(root, iter(edges[root]))]
+        while work:
+            node, successors = work[-1]
+            for nxt in successors:
+                if nxt not in index:
+                    index[nxt] = lowlink[nxt] = len(index)
+                    stack.append(nxt)
+                    on_stack.add(nxt)
+                    work.append((nxt, iter(edges.get(nxt, ()))))
+                    if len(work) > _MAX_CYCLE_DEPTH:
+                        raise ValueError(
+                            f"Composite sink nesting depth exceeds {_MAX_CYCLE_DEPTH}"
+                        )
+                    break
+                if nxt in on_stack:
+                    lowlink[node] = min(lowlink[node], index[nxt])
+            else:
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    lowlink[parent] = min(lowlink[parent], lowlink[node])
+                if lowlink[node] == index[node]:
+                    scc: list[str] = []
+                    while True:
+                        member = stack.pop()
+                        on_stack.discard(member)
+                        scc.append(member)
+                        if member == node:
+                            break
+                    scc.reverse()
+                    if len(scc) > 1 or node in edges.get(node, ()):
+                        cycles.append(_cycle_path(scc[0], set(scc), edges))
+    return cycles
 
 
 # ---------------------------------------------------------------------------
@@ -200,11 +286,16 @@ def parse_pipeline_specs(
 # ---------------------------------------------------------------------------
 
 
-def validate_runtime_config(config: dict[str, Any]) -> None:
+def validate_runtime_config(config: dict[str, Any]) -> dict[str, PipelineSpec]:
     """Runtime-specific validation of an already-loaded config dict.
 
     Call this after bootstrap.load_config() for runtime-specific checks.
-    Raises ValueError with field-level path information on any invalid value.
+    Sink-reference and per-device problems are collected in a single pass and
+    raised together as one ValueError (one field-level message per line), so
+    a config with several mistakes can be fixed in one go.
+
+    Returns the parsed ``{name: PipelineSpec}`` mapping so callers do not
+    have to parse the 'pipelines' section a second time.
     """
     # Version: only v1 supported
     version = config.get("version", 1)
@@ -214,6 +305,8 @@ def validate_runtime_config(config: dict[str, Any]) -> None:
             "Only version 1 is supported."
         )
 
+    errors: list[str] = []
+
     # Parse sinks section (optional).
     # Both a missing 'sinks' key and an explicit 'sinks: {}' resolve to an empty
     # dict and are treated identically — neither triggers sink validation. If a
@@ -223,100 +316,135 @@ def validate_runtime_config(config: dict[str, Any]) -> None:
     sink_specs: dict[str, SinkSpec] = {}
     if sinks_raw:
         sink_specs = parse_sink_specs(sinks_raw)
-        # Validate composite references and check for cycles
+        # Validate composite references, then report every cycle found
         for name, spec in sink_specs.items():
-            if spec.type == "composite":
-                for sub in spec.sub_sinks:
-                    if sub not in sink_specs:
-                        raise ValueError(
-                            f"sinks.{name!r} references unknown sink {sub!r}"
-                        )
-                _detect_cycle(name, sink_specs)
+            if spec.type != "composite":
+                continue
+            for sub in spec.sub_sinks:
+                if sub not in sink_specs:
+                    errors.append(f"sinks.{name!r} references unknown sink {sub!r}")
+        try:
+            cycles = _find_sink_cycles(sink_specs)
+        except ValueError as exc:
+            errors.append(str(exc))
+        else:
+            for scc in cycles:
+                cycle = " -> ".join((*scc, scc[0]))
+                errors.append(f"Cycle detected in composite sinks: {cycle}")
+
+    # Membership sets built once — every reference check below is a set lookup.
+    sink_keys = frozenset(sink_specs)
+    have_sinks = bool(sink_keys)
 
     # Validate defaults.sink reference
     defaults = config.get("defaults", {})
     default_sink = defaults.get("sink")
-    if default_sink is not None:
-        if not sink_specs:
-            raise ValueError(
+    if default_sink is not None and default_sink not in sink_keys:
+        if not have_sinks:
+            errors.append(
                 f"defaults.sink={default_sink!r} but no 'sinks' section defined"
             )
-        if default_sink not in sink_specs:
-            raise ValueError(
+        else:
+            errors.append(
                 f"defaults.sink={default_sink!r} is not defined in 'sinks' section"
             )
 
-    # Parse pipelines section (required)
+    # Parse pipelines section (required) — device checks below depend on it.
     pipelines_raw = config.get("pipelines")
     if not isinstance(pipelines_raw, dict) or not pipelines_raw:
-        raise ValueError("'pipelines' section is required")
+        errors.append("'pipelines' section is required")
+        raise ValueError("\n".join(errors))
     pipeline_specs = parse_pipeline_specs(pipelines_raw)
+    pipeline_keys = frozenset(pipeline_specs)
+
+    # Default poll_interval resolved and converted once; devices that do not
+    # override it reuse the parsed value.  A non-numeric default is reported
+    # against every device that inherits it.
+    default_interval_raw = defaults.get("poll_interval", 30)
+    default_interval: float | None
+    try:
+        default_interval = float(default_interval_raw)
+    except (TypeError, ValueError):
+        default_interval = None
+
+    # Accepted poll group spellings, built once for the whole device list.
+    valid_groups = frozenset(g.value for g in BlockGroup) | frozenset(
+        g.name.lower() for g in BlockGroup
+    )
+    allowed_groups = sorted(g.value for g in BlockGroup)
 
     # Per-device validation
     devices = config.get("devices", [])
     for idx, entry in enumerate(devices):
         dev_id = entry.get("id", "")
         if not isinstance(dev_id, str) or not dev_id.strip():
-            raise ValueError(
+            errors.append(
                 f"devices[{idx}]: 'id' must be a non-empty string, got {dev_id!r}"
             )
         profile_id = entry.get("profile_id", "")
         if not isinstance(profile_id, str) or not profile_id.strip():
-            raise ValueError(
+            errors.append(
                 f"devices[{idx}]: 'profile_id' must be a non-empty string, "
                 f"got {profile_id!r}"
             )
 
         # poll_interval must be a positive number
-        raw = entry.get("poll_interval", defaults.get("poll_interval", 30))
-        try:
-            val = float(raw)
-        except (TypeError, ValueError) as exc:
-            raise ValueError(
-                f"devices[{idx}].poll_interval must be a number, got {raw!r}"
-            ) from exc
-        if val <= 0:
-            raise ValueError(f"devices[{idx}].poll_interval must be > 0, got {val}")
+        raw = entry.get("poll_interval", default_interval_raw)
+        val: float | None
+        if raw is default_interval_raw and default_interval is not None:
+            val = default_interval
+        else:
+            try:
+                val = float(raw)
+            except (TypeError, ValueError):
+                errors.append(
+                    f"devices[{idx}].poll_interval must be a number, got {raw!r}"
+                )
+                val = None
+        if val is not None and val <= 0:
+            errors.append(f"devices[{idx}].poll_interval must be > 0, got {val}")
 
         # poll_groups (optional) must be a non-empty list of known group names
         poll_groups = entry.get("poll_groups", defaults.get("poll_groups"))
         if poll_groups is not None:
             if not isinstance(poll_groups, list) or not poll_groups:
-                raise ValueError(f"devices[{idx}].poll_groups must be a non-empty list")
-            for item in poll_groups:
-                if not isinstance(item, str):
-                    raise ValueError(
-                        f"devices[{idx}].poll_groups entries must be strings"
-                    )
-                valid = {g.value for g in BlockGroup} | {
-                    g.name.lower() for g in BlockGroup
-                }
-                if item.lower() not in valid:
-                    allowed = sorted(g.value for g in BlockGroup)
-                    raise ValueError(
-                        f"devices[{idx}].poll_groups contains unknown group {item!r}; "
-                        f"allowed: {allowed}"
-                    )
+                errors.append(f"devices[{idx}].poll_groups must be a non-empty list")
+            else:
+                for item in poll_groups:
+                    if not isinstance(item, str):
+                        errors.append(
+                            f"devices[{idx}].poll_groups entries must be strings"
+                        )
+                    elif item.lower() not in valid_groups:
+                        errors.append(
+                            f"devices[{idx}].poll_groups contains unknown group "
+                            f"{item!r}; allowed: {allowed_groups}"
+                        )
 
         # pipeline is required per device
         dev_pipeline = entry.get("pipeline")
         if not dev_pipeline:
-            raise ValueError(f"devices[{idx}]: 'pipeline' is required")
-        if dev_pipeline not in pipeline_specs:
-            raise ValueError(
+            errors.append(f"devices[{idx}]: 'pipeline' is required")
+        elif dev_pipeline not in pipeline_keys:
+            errors.append(
                 f"devices[{idx}].pipeline={dev_pipeline!r} "
                 "is not defined in 'pipelines' section"
             )
 
-        # Per-device sink reference
-        dev_sink = entry.get("sink", default_sink)
-        if dev_sink is not None:
-            if not sink_specs:
-                raise ValueError(
+        # Per-device sink reference.  Only a sink the entry sets itself: an
+        # inherited defaults.sink was already reported once above.
+        dev_sink = entry.get("sink")
+        if dev_sink is not None and dev_sink not in sink_keys:
+            if not have_sinks:
+                errors.append(
                     f"devices[{idx}].sink={dev_sink!r} but no 'sinks' section defined"
                 )
-            if dev_sink not in sink_specs:
-                raise ValueError(
+            else:
+                errors.append(
                     f"devices[{idx}].sink={dev_sink!r} "
                     "is not defined in 'sinks' section"
                 )
+
+    if errors:
+        raise ValueError("\n".join(errors))
+    return pipeline_specs
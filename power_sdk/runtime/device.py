@@ -4,21 +4,30 @@ from __future__ import annotations
 
 import contextlib
 import time
+from collections.abc import Mapping
 from dataclasses import dataclass, field
+from types import MappingProxyType
 from typing import Any, Literal
 
 from ..contracts.client import ClientInterface
 from ..models.types import BlockGroup
 
+# Shared read-only state for error snapshots — avoids a fresh dict per failure.
+_EMPTY_STATE: Mapping[str, Any] = MappingProxyType({})
 
-@dataclass
+
+@dataclass(slots=True)
 class DeviceSnapshot:
-    """Immutable result of a single poll cycle."""
+    """Immutable result of a single poll cycle.
+
+    ``state`` is a read-only view; consumers must copy it before mutating.
+    Slotted: one instance is built per poll (or push event) per device.
+    """
 
     device_id: str
     model: str
     timestamp: float
-    state: dict[str, Any]
+    state: Mapping[str, Any]
     blocks_read: int
     duration_ms: float = 0.0
     error: Exception | None = field(default=None, compare=False)
@@ -69,6 +78,13 @@ class DeviceRuntime:
         self.poll_groups = poll_groups
         self.write_force_allowed = write_force_allowed
         self.write_require_validation = write_require_validation
+        # The client profile is fixed for the client's lifetime, so the model
+        # name is resolved once here rather than on every poll.  A profile that
+        # cannot be read (e.g. a broken transport) falls back to "unknown".
+        try:
+            self._model: str = client.profile.model
+        except Exception:
+            self._model = "unknown"
         self._last_snapshot: DeviceSnapshot | None = None
 
     def poll_once(
@@ -82,50 +98,49 @@ class DeviceRuntime:
             connect: Call client.connect() before reading.
             disconnect: Call client.disconnect() after reading (even on error).
         """
-        # Cache model name before the try block so the error snapshot can reference
-        # it even if client.profile raises (e.g. a broken transport mid-connect).
-        try:
-            _model: str = self.client.profile.model
-        except Exception:
-            _model = "unknown"
-
-        t = time.time()
-        t0 = time.monotonic()
+        t_ns = time.time_ns()
+        t0_ns = time.monotonic_ns()
+        state: Mapping[str, Any] = _EMPTY_STATE
+        blocks_read = 0
+        error: Exception | None = None
         try:
             if connect:
                 self.client.connect()
             blocks = []
             for group in self.poll_groups:
                 blocks.extend(self.client.read_group(group, partial_ok=True))
-            state = dict(self.client.get_device_state())
-            snapshot = DeviceSnapshot(
-                device_id=self.device_id,
-                model=_model,
-                timestamp=t,
-                state=state,
-                blocks_read=len(blocks),
-                duration_ms=(time.monotonic() - t0) * 1000.0,
-            )
+            # get_device_state() returns a fresh dict; wrap it instead of copying.
+            state = MappingProxyType(self.client.get_device_state())
+            blocks_read = len(blocks)
         except Exception as exc:
-            snapshot = DeviceSnapshot(
-                device_id=self.device_id,
-                model=_model,
-                timestamp=t,
-                state={},
-                blocks_read=0,
-                duration_ms=(time.monotonic() - t0) * 1000.0,
-                error=exc,
-            )
+            error = exc
         finally:
+            # Measured before disconnect so duration covers the read cycle only.
+            duration_ms = (time.monotonic_ns() - t0_ns) / 1e6
             if disconnect:
                 with contextlib.suppress(Exception):
                     self.client.disconnect()
 
+        snapshot = DeviceSnapshot(
+            device_id=self.device_id,
+            model=self._model,
+            timestamp=t_ns / 1e9,
+            state=state,
+            blocks_read=blocks_read,
+            duration_ms=duration_ms,
+            error=error,
+        )
+
         # Reference assignment is atomic under CPython's GIL.
         # Under free-threading (PEP 703) a RLock would be needed here.
         self._last_snapshot = snapshot
         return snapshot
 
+    @property
+    def model(self) -> str:
+        """Device model name from the client profile, resolved at construction."""
+        return self._model
+
     @property
     def last_snapshot(self) -> DeviceSnapshot | None:
         return self._last_snapshot
@@ -16,6 +16,9 @@ from ..plugins.registry import PluginRegistry, load_plugins
 from ..transport.factory import TransportFactory
 from .spec import VALID_MODES, PipelineSpec
 
+# Manifest attributes required for a functional pipeline.
+_REQUIRED_FACTORIES = ("protocol_layer_factory", "parser_factory", "profile_loader")
+
 
 @dataclass
 class ResolvedPipeline:
@@ -46,6 +49,10 @@ class StageResolver:
         self._registry = (
             plugin_registry if plugin_registry is not None else load_plugins()
         )
+        # Transport keys are snapshotted once per resolver: a resolver lives for
+        # one config load, and validate() runs once per referenced pipeline.
+        self._transport_list = TransportFactory.list_transports()
+        self._transports = frozenset(self._transport_list)
 
     def validate(self, spec: PipelineSpec) -> None:
         """Validate all stage keys in *spec*.
@@ -64,13 +71,11 @@ class StageResolver:
             )
 
         # --- transport ---
-        if spec.transport:
-            available = TransportFactory.list_transports()
-            if spec.transport not in available:
-                errors.append(
-                    f"pipeline {spec.name!r}: transport={spec.transport!r} "
-                    f"is not registered; available: {available}"
-                )
+        if spec.transport and spec.transport not in self._transports:
+            errors.append(
+                f"pipeline {spec.name!r}: transport={spec.transport!r} "
+                f"is not registered; available: {self._transport_list}"
+            )
 
         # --- plugin (vendor + protocol) ---
         if spec.vendor and spec.protocol:
@@ -83,15 +88,11 @@ class StageResolver:
                 )
             else:
                 # All three factories are required for a functional pipeline
-                for attr, label in [
-                    ("protocol_layer_factory", "protocol_layer_factory"),
-                    ("parser_factory", "parser_factory"),
-                    ("profile_loader", "profile_loader"),
-                ]:
+                for attr in _REQUIRED_FACTORIES:
                     if getattr(manifest, attr) is None:
                         errors.append(
                             f"pipeline {spec.name!r}: plugin {manifest.key!r} "
-                            f"is missing {label}"
+                            f"is missing {attr}"
                         )
 
         if errors:
@@ -4,13 +4,19 @@ from __future__ import annotations
 
 import asyncio
 import contextlib
+import functools
+import importlib.util
+import inspect
 import logging
 import random
 import time
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any
 
-from .device import DeviceRuntime, DeviceSnapshot
+from .channel import DROP_POLICIES, BurstPool, SnapshotChannel
+from .device import _EMPTY_STATE, DeviceRuntime, DeviceSnapshot
 from .push import PushCallbackAdapter
 
 if TYPE_CHECKING:
@@ -18,15 +24,24 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# asyncio.timeout() is Python 3.11+; requires-python still admits 3.10.
+_HAS_ASYNCIO_TIMEOUT = hasattr(asyncio, "timeout")
+
 
 # ---------------------------------------------------------------------------
 # DeviceMetrics
 # ---------------------------------------------------------------------------
 
+# Weight of the newest poll in DeviceMetrics.duration_ema_ms.
+_DURATION_EMA_ALPHA = 0.2
+
 
-@dataclass
+@dataclass(slots=True)
 class DeviceMetrics:
-    """Accumulated counters for one device's poll history."""
+    """Accumulated counters for one device's poll history.
+
+    Slotted: record() updates several fields on every poll or push event.
+    """
 
     device_id: str
     poll_ok: int = 0
@@ -35,16 +50,26 @@ class DeviceMetrics:
     last_ok_at: float | None = None
     last_error_at: float | None = None
     # Phase 3 extensions
+    # Written on the event loop thread, except by a push adapter whose loop
+    # has stopped: it counts what it discards from transport threads.
     dropped_snapshots: int = 0
     consecutive_errors: int = 0
     reconnect_attempts: int = 0
     last_snapshot_at: float | None = None
+    # Exponential moving average of poll duration (0.0 until the first poll)
+    duration_ema_ms: float = 0.0
 
     def record(self, snapshot: DeviceSnapshot) -> None:
         """Update metrics from snapshot."""
         self.last_duration_ms = snapshot.duration_ms
+        if self.duration_ema_ms:
+            self.duration_ema_ms += _DURATION_EMA_ALPHA * (
+                snapshot.duration_ms - self.duration_ema_ms
+            )
+        else:
+            self.duration_ema_ms = snapshot.duration_ms
         self.last_snapshot_at = snapshot.timestamp
-        if snapshot.ok:
+        if snapshot.error is None:  # snapshot.ok, minus the property call
             self.poll_ok += 1
             self.last_ok_at = snapshot.timestamp
             self.consecutive_errors = 0
@@ -55,97 +80,106 @@ class DeviceMetrics:
 
 
 # ---------------------------------------------------------------------------
-# Queue helpers
+# Sink worker
 # ---------------------------------------------------------------------------
 
+# Upper bound on snapshots handed to the sink per worker iteration.
+_SINK_BATCH_MAX = 64
 
-def _enqueue_snapshot(
-    queue: asyncio.Queue,  # type: ignore[type-arg]
-    snapshot: DeviceSnapshot,
-    drop_policy: str,
-    metrics: DeviceMetrics,
+
+def _on_producer_done(
+    channel: SnapshotChannel, device_id: str, producer: asyncio.Task[None]
 ) -> None:
-    """Enqueue snapshot into the per-device bounded queue.
+    """Producer task done callback: end the device's snapshot stream.
 
-    drop_oldest: discard the head of the queue to make room.
-    drop_new: discard incoming snapshot when queue is full.
+    A crash is logged right away rather than when run() returns, which for a
+    long-running Executor may be much later; the other devices keep running.
     """
-    if drop_policy == "drop_oldest":
-        if queue.full():
-            try:
-                queue.get_nowait()  # discard oldest — no task_done (not using join)
-                metrics.dropped_snapshots += 1
-            except asyncio.QueueEmpty:
-                pass
-        try:
-            queue.put_nowait(snapshot)
-        except asyncio.QueueFull:
-            # Concurrent producer activity can refill the queue between get_nowait()
-            # and put_nowait(); drop the new snapshot to preserve loop liveness.
-            metrics.dropped_snapshots += 1
-    else:  # "drop_new"
-        try:
-            queue.put_nowait(snapshot)
-        except asyncio.QueueFull:
-            metrics.dropped_snapshots += 1
+    channel.close()
+    if producer.cancelled():
+        return
+    exc = producer.exception()
+    if isinstance(exc, Exception):
+        logger.error(
+            "Device loop for %r raised unexpected exception: %s: %s",
+            device_id,
+            type(exc).__name__,
+            exc,
+        )
 
 
 async def _sink_worker(
-    device_id: str,
-    queue: asyncio.Queue,  # type: ignore[type-arg]
+    label: str,
+    channels: Sequence[SnapshotChannel],
     sink: Any,
-    stop_event: asyncio.Event,
-    producer_task: asyncio.Task[None] | None = None,
 ) -> None:
-    """Drain the per-device queue and write to sink.
-
-    Runs until stop_event is set AND queue is empty.
-    Sink errors are logged as ERROR; draining continues.
-
-    producer_task: when provided, the worker also exits when the producer is
-    done (crash or normal exit) and the queue is empty.  Passing None means
-    the worker relies solely on stop_event for termination.
+    """Drain every channel feeding *sink* and write to it.
+
+    The channels share one wakeup event, so the worker sleeps until any of
+    them has snapshots — no periodic wakeups while idle — then takes up to
+    _SINK_BATCH_MAX from each without awaiting and hands the combined batch
+    to ``sink.write_many()`` when the sink provides it, else to write() one
+    snapshot at a time.  Per-device order is kept; each channel keeps its own
+    bound and drop policy.  Exits once every channel is closed (the Executor
+    closes one when its device's producer task has finished) and everything
+    queued has been written.  Sink errors are logged as ERROR; draining
+    continues.
     """
-    def _producer_done() -> bool:
-        return producer_task is not None and producer_task.done()
-
-    while not ((stop_event.is_set() or _producer_done()) and queue.empty()):
-        try:
-            snapshot = await asyncio.wait_for(queue.get(), timeout=0.05)
-        except asyncio.TimeoutError:
+    write = sink.write
+    write_many = getattr(sink, "write_many", None)
+    wait = channels[0].wait
+    takes = [channel.take for channel in channels]
+    log_enabled = logger.isEnabledFor
+    batch: list[DeviceSnapshot] = []
+    while True:
+        batch = []
+        for take in takes:
+            batch += take(_SINK_BATCH_MAX)
+        if not batch:
+            if all(channel.closed for channel in channels):
+                return
+            await wait()
             continue
         try:
-            await sink.write(snapshot)
-        except Exception as exc:
-            logger.error(
-                "[%s] sink.write failed: %s: %s",
-                device_id,
-                type(exc).__name__,
-                exc,
-            )
-
-    # After the while loop exits — drain any remaining items.
-    # CancelledError (BaseException, not Exception) must be caught explicitly so
-    # that task cancellation during an async write is logged and re-raised rather
-    # than silently swallowed by the broad `except Exception` handler.
-    while not queue.empty():
-        try:
-            snapshot = queue.get_nowait()
-            await sink.write(snapshot)
+            if write_many is not None:
+                try:
+                    await write_many(batch)
+                except Exception as exc:
+                    if log_enabled(logging.ERROR):
+                        logger.error(
+                            "[%s] sink.write_many failed (%d snapshots): %s: %s",
+                            label,
+                            len(batch),
+                            type(exc).__name__,
+                            exc,
+                        )
+            else:
+                for snapshot in batch:
+                    try:
+                        await write(snapshot)
+                    except Exception as exc:
+                        # A broken sink fails every write: check the level
+                        # before building the arguments each time.
+                        if log_enabled(logging.ERROR):
+                            logger.error(
+                                "[%s] sink.write failed: %s: %s",
+                                snapshot.device_id,
+                                type(exc).__name__,
+                                exc,
+                            )
         except asyncio.CancelledError:
-            logger.warning(
-                "[%s] sink drain interrupted by cancellation;"
-                " ~%d snapshots may be lost",
-                device_id,
-                queue.qsize(),
-            )
-            raise  # re-raise so the task is correctly marked as cancelled
-        except Exception as exc:
-            logger.warning(
-                "[%s] sink flush failed during drain: %s",
-                device_id,
-                exc,
-            )
+            # CancelledError is a BaseException, so the handlers above do not
+            # catch it; log what is being abandoned and re-raise so the task is
+            # correctly marked as cancelled.
+            lost = len(batch) + sum(len(channel) for channel in channels)
+            if lost > 1:
+                logger.warning(
+                    "[%s] sink drain interrupted by cancellation;"
+                    " ~%d snapshots may be lost",
+                    label,
+                    lost,
+                )
+            raise
 
 
 # ---------------------------------------------------------------------------
@@ -157,86 +191,148 @@ async def _device_loop(
     runtime: DeviceRuntime,
     metrics: DeviceMetrics,
     stop_event: asyncio.Event,
-    queue: asyncio.Queue,  # type: ignore[type-arg]
+    channel: SnapshotChannel,
     *,
     connect: bool,
     jitter_max: float,
-    drop_policy: str,
     reconnect_after_errors: int,
     reconnect_cooldown_s: float,
+    reconnect_max_cooldown_s: float = 60.0,
+    adaptive_interval: bool = False,
+    interval_jitter: float = 0.05,
+    poll_pool: ThreadPoolExecutor | None = None,
+    stop_wait: asyncio.Future[Any] | None = None,
 ) -> None:
     """Run poll_once() in a loop for one device until stop_event is set.
 
     Jitter: initial random delay capped at min(jitter_max, poll_interval * 0.1).
     Snapshots are enqueued (not written directly) — sink worker drains separately.
-    Reconnect: triggered after N consecutive errors with a per-device cooldown.
+    Reconnect: triggered after N consecutive errors; the cooldown before the
+    next attempt doubles per consecutive failed reconnect (capped at
+    reconnect_max_cooldown_s) and is jittered by ±50%.
+    Adaptive interval: when enabled, the wait between polls stretches to twice
+    the average poll duration (capped at 4x poll_interval) while polls take
+    more than half the interval, so a slow device is not polled back-to-back.
+    Interval jitter: each step of the schedule is scaled by a random factor in
+    1 ± interval_jitter, so devices started together drift out of phase
+    instead of hitting shared transports and sinks in lockstep; the average
+    rate stays one poll per interval.
+    Blocking client calls run on *poll_pool* (the loop's default executor when
+    None).  A runtime that also defines a coroutine
+    ``poll_once_async(connect, disconnect)`` is polled by awaiting it directly,
+    skipping the thread hop.
+    *stop_wait*, when given, is a future resolving with *stop_event* that the
+    caller shares among its loops and cancels itself.
     """
-    logger.info(
-        "Loop started: %s (interval=%.0fs)", runtime.device_id, runtime.poll_interval
-    )
+    loop = asyncio.get_running_loop()
+    # Loop invariants bound once rather than re-resolved on every cycle.
+    device_id = runtime.device_id
+    interval = runtime.poll_interval
+    poll_once = runtime.poll_once
+    poll_once_async = getattr(runtime, "poll_once_async", None)
+    if not inspect.iscoroutinefunction(poll_once_async):
+        poll_once_async = None
+    put = channel.put
+    stopped = stop_event.is_set
+    monotonic = time.monotonic
+    wait = asyncio.wait
+    wait_for = asyncio.wait_for
+    log_enabled = logger.isEnabledFor
+    # Guard against transport hangs: executor jobs cannot be cancelled
+    # mid-execution, so a stuck OS socket would block the pool thread forever.
+    # Polls are wrapped with wait_for so we get an error snapshot and the loop
+    # continues rather than leaking threads until exhaustion.
+    poll_timeout = max(interval * 3, 60.0)
+    max_step = interval * 4  # adaptive_interval ceiling
+    logger.info("Loop started: %s (interval=%.0fs)", device_id, interval)
+
+    # One waiter on stop_event for the loop's whole life, shared by the jitter
+    # and every interval wait — no fresh wait_for task + coroutine per cycle.
+    # asyncio.wait() never cancels it, so one future can serve every loop.
+    own_stop_wait = stop_wait is None
+    if stop_wait is None:
+        stop_wait = asyncio.ensure_future(stop_event.wait())
 
     # Initial jitter to stagger device start times
-    jitter = random.uniform(0.0, min(jitter_max, runtime.poll_interval * 0.1))
+    jitter = random.uniform(0.0, min(jitter_max, interval * 0.1))
     if jitter > 0.0:
         try:
-            await asyncio.wait_for(stop_event.wait(), timeout=jitter)
-            logger.info("Loop cancelled during jitter: %s", runtime.device_id)
+            done, _ = await wait({stop_wait}, timeout=jitter)
+        except asyncio.CancelledError:
+            if own_stop_wait:
+                stop_wait.cancel()
+            raise
+        if done:
+            logger.info("Loop cancelled during jitter: %s", device_id)
             return  # stop requested during jitter
-        except asyncio.TimeoutError:
-            pass  # normal: jitter elapsed
 
-    first = True
-    last_reconnect_at: float = 0.0
+    # Connect only on the first cycle; disconnect is handled in finally.
+    # Pool polls are pre-bound partials, so a cycle packs no arguments.
+    poll_connect = connect
+    poll_call = functools.partial(poll_once, connect, False)
+    poll_steady = functools.partial(poll_once, False, False)
+    next_reconnect_at: float = 0.0
+    failed_reconnects = 0
+    # Fixed-rate schedule: each poll is due one interval after the previous
+    # deadline, not after the previous poll finished, so poll duration does
+    # not accumulate into drift.
+    deadline = monotonic()
+    # Warn once when a device starts overrunning, not on every late cycle.
+    overrunning = False
 
     try:
-        while not stop_event.is_set():
-            # Connect only on first iteration.
-            # Guard against transport hangs: asyncio.to_thread cannot be cancelled
-            # mid-execution, so a stuck OS socket would block the thread-pool thread
-            # forever.  Wrap with wait_for so we get an error snapshot and the loop
-            # continues rather than leaking threads until exhaustion.
-            poll_timeout = max(runtime.poll_interval * 3, 60.0)
+        while not stopped():
             try:
-                snapshot = await asyncio.wait_for(
-                    asyncio.to_thread(
-                        runtime.poll_once,
-                        connect and first,  # connect arg
-                        False,  # disconnect arg — handled in finally
-                    ),
-                    timeout=poll_timeout,
-                )
+                if poll_once_async is None:
+                    # wait_for takes an executor future as-is — no extra Task
+                    snapshot = await wait_for(
+                        loop.run_in_executor(poll_pool, poll_call),
+                        timeout=poll_timeout,
+                    )
+                elif _HAS_ASYNCIO_TIMEOUT:
+                    # A coroutine would be wrapped in a Task by wait_for
+                    async with asyncio.timeout(poll_timeout):
+                        snapshot = await poll_once_async(poll_connect, False)
+                else:
+                    snapshot = await wait_for(
+                        poll_once_async(poll_connect, False),
+                        timeout=poll_timeout,
+                    )
             except asyncio.TimeoutError:
                 logger.error(
                     "[%s] poll_once timed out after %.0fs — possible transport hang",
-                    runtime.device_id,
+                    device_id,
                     poll_timeout,
                 )
                 snapshot = DeviceSnapshot(
-                    device_id=runtime.device_id,
-                    model=runtime.client.profile.model,
+                    device_id=device_id,
+                    model=runtime.model,
                     timestamp=time.time(),  # wall-clock Unix timestamp, not monotonic
-                    state={},
+                    state=_EMPTY_STATE,
                     blocks_read=0,
                     duration_ms=poll_timeout * 1000.0,
                     error=TimeoutError(
                         f"poll_once timed out after {poll_timeout:.0f}s"
                     ),
                 )
-            first = False
+            poll_connect = False
+            poll_call = poll_steady
             metrics.record(snapshot)
 
-            # Logging
+            # Logging — level checked first so a disabled level costs no
+            # argument lookups (isEnabledFor is cached by the logging module)
             if snapshot.ok:
-                logger.debug(
-                    "[%s] poll_ok blocks=%d duration=%.1fms",
-                    runtime.device_id,
-                    snapshot.blocks_read,
-                    snapshot.duration_ms,
-                )
-            else:
+                if log_enabled(logging.DEBUG):
+                    logger.debug(
+                        "[%s] poll_ok blocks=%d duration=%.1fms",
+                        device_id,
+                        snapshot.blocks_read,
+                        snapshot.duration_ms,
+                    )
+            elif log_enabled(logging.WARNING):
                 logger.warning(
                     "[%s] poll_error %s: %s (duration=%.1fms)",
-                    runtime.device_id,
+                    device_id,
                     type(snapshot.error).__name__,
                     snapshot.error,
                     snapshot.duration_ms,
@@ -248,27 +344,34 @@ async def _device_loop(
                 and reconnect_after_errors > 0
                 and metrics.consecutive_errors >= reconnect_after_errors
             ):
-                now = time.monotonic()
-                if now - last_reconnect_at >= reconnect_cooldown_s:
+                now = monotonic()
+                if now >= next_reconnect_at:
                     logger.info(
                         "[%s] reconnecting after %d consecutive errors",
-                        runtime.device_id,
+                        device_id,
                         metrics.consecutive_errors,
                     )
                     with contextlib.suppress(Exception):
-                        await asyncio.to_thread(runtime.client.disconnect)
+                        await loop.run_in_executor(
+                            poll_pool, runtime.client.disconnect
+                        )
                     try:
                         # connect_once: single attempt, no internal sleep —
                         # keeps the thread-pool thread free immediately on
-                        # failure; retry cadence is handled by reconnect_cooldown_s
-                        await asyncio.to_thread(runtime.client.connect_once)
+                        # failure; retry cadence is handled by the backoff below
+                        await loop.run_in_executor(
+                            poll_pool, runtime.client.connect_once
+                        )
                     except Exception as _reconnect_exc:
                         logger.warning(
                             "[%s] reconnect attempt %d failed: %s",
-                            runtime.device_id,
+                            device_id,
                             metrics.reconnect_attempts + 1,
                             _reconnect_exc,
                         )
+                        failed_reconnects += 1
+                    else:
+                        failed_reconnects = 0
                     metrics.reconnect_attempts += 1
                     # Reset consecutive_errors regardless of success so the next
                     # N errors must accumulate before triggering another reconnect.
@@ -276,24 +379,55 @@ async def _device_loop(
                     # poll (if still failing) would immediately re-trigger when the
                     # cooldown elapses — causing rapid-fire reconnect storms.
                     metrics.consecutive_errors = 0
-                    last_reconnect_at = now
+                    # Exponential backoff with jitter: a device that stays
+                    # offline is retried ever less often (capped), and devices
+                    # that failed together do not retry in lockstep.
+                    cooldown = min(
+                        reconnect_max_cooldown_s,
+                        reconnect_cooldown_s * 2 ** min(failed_reconnects, 6),
+                    )
+                    next_reconnect_at = now + cooldown * random.uniform(0.5, 1.5)
 
-            # Enqueue snapshot for sink worker — non-blocking
-            _enqueue_snapshot(queue, snapshot, drop_policy, metrics)
+            # Hand snapshot to the sink worker — non-blocking
+            put(snapshot)
 
-            # Wait for poll_interval or stop_event
-            try:
-                await asyncio.wait_for(stop_event.wait(), timeout=runtime.poll_interval)
+            # Wait for the next deadline or stop_event
+            step = interval
+            if adaptive_interval:
+                step = min(
+                    max_step, max(interval, 2.0 * metrics.duration_ema_ms / 1000.0)
+                )
+            if interval_jitter:
+                step *= random.uniform(1.0 - interval_jitter, 1.0 + interval_jitter)
+            deadline += step
+            delay = deadline - monotonic()
+            if delay < 0.0:
+                logger.log(
+                    logging.DEBUG if overrunning else logging.WARNING,
+                    "[%s] poll overran its %.1fs interval by %.1fms",
+                    device_id,
+                    step,
+                    -delay * 1000.0,
+                )
+                overrunning = True
+                # Re-anchor on now: poll again at once, but never in a burst
+                # of catch-up polls for every slot missed during the overrun.
+                deadline -= delay
+                delay = 0.0
+            else:
+                overrunning = False
+            done, _ = await wait({stop_wait}, timeout=delay)
+            if done:
                 break  # stop_event was set
-            except asyncio.TimeoutError:
-                pass  # interval elapsed — continue loop
 
     finally:
+        if own_stop_wait:
+            stop_wait.cancel()
         # Disconnect on loop exit (connect=True means we opened the connection)
         if connect:
             with contextlib.suppress(Exception):
-                await asyncio.to_thread(runtime.client.disconnect)
-        logger.info("Loop stopped: %s", runtime.device_id)
+                await loop.run_in_executor(poll_pool, runtime.client.disconnect)
+        logger.info("Loop stopped: %s", device_id)
 
 
 # ---------------------------------------------------------------------------
@@ -307,10 +441,12 @@ async def _push_loop(
     stop_event: asyncio.Event,
     *,
     connect: bool,
+    stop_wait: asyncio.Future[Any] | None = None,
 ) -> None:
     """Push-mode lifecycle manager for one device.
 
-    Connects (if requested), then waits for *stop_event*.
+    Connects (if requested), then waits for *stop_event* (via the shared
+    *stop_wait* future when the caller provides one).
     All data flows in via ``adapter.on_data()`` called by the transport plugin
     — this coroutine only manages the connection lifecycle.
     """
@@ -327,7 +463,11 @@ async def _push_loop(
             )
             raise
     try:
-        await stop_event.wait()
+        if stop_wait is None:
+            await stop_event.wait()
+        else:
+            # asyncio.wait() leaves the shared future alone if we are cancelled
+            await asyncio.wait({stop_wait})
     finally:
         if connect:
             with contextlib.suppress(Exception):
@@ -348,6 +488,45 @@ class _NoOpSink:
         pass
 
 
+def _discard(snapshot: DeviceSnapshot) -> None:
+    """Channel put() for devices whose sink is a _NoOpSink: nothing to write."""
+
+
+# ---------------------------------------------------------------------------
+# Optional uvloop event loop
+# ---------------------------------------------------------------------------
+
+
+def install_uvloop() -> bool:
+    """Make new event loops uvloop loops, if uvloop is installed.
+
+    Call before asyncio.run() — the policy cannot change a loop that is
+    already running, so Executor itself cannot switch it.  uvloop is an
+    optional dependency (``pip install power-sdk[uvloop]``).
+
+    Returns:
+        True if the uvloop policy was installed, False if uvloop is missing.
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return False
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    return True
+
+
+def _log_uvloop_hint(loop: asyncio.AbstractEventLoop) -> None:
+    """Point out an installed-but-unused uvloop (silent when not installed)."""
+    if type(loop).__module__.startswith("uvloop"):
+        return
+    if importlib.util.find_spec("uvloop") is None:
+        return
+    logger.info(
+        "uvloop is installed but not in use; call"
+        " power_sdk.runtime.install_uvloop() before asyncio.run()"
+    )
+
+
 # ---------------------------------------------------------------------------
 # Executor
 # ---------------------------------------------------------------------------
@@ -356,9 +535,13 @@ class _NoOpSink:
 class Executor:
     """Manages async per-device poll loops with graceful shutdown.
 
-    Per-device snapshots are enqueued into bounded asyncio.Queues and drained
-    by per-device sink worker coroutines. This decouples polling speed from
-    sink throughput and provides backpressure control.
+    Per-device snapshots are enqueued into bounded SnapshotChannels and drained
+    by one sink worker coroutine per distinct sink. This decouples polling
+    speed from sink throughput and provides backpressure control; a full
+    channel first borrows from *queue_burst* slots shared by all devices
+    before its drop policy applies.  Devices
+    without a sink get no worker and their snapshots are discarded right
+    away; DeviceMetrics are recorded either way.
 
     Usage:
         async with Executor(registry, sink=MemorySink()) as executor:
@@ -380,32 +563,54 @@ class Executor:
         connect: bool = True,
         jitter_max: float = 5.0,
         queue_maxsize: int = 100,
+        queue_burst: int = 0,
         drop_policy: str = "drop_oldest",
         reconnect_after_errors: int = 3,
         reconnect_cooldown_s: float = 5.0,
+        reconnect_max_cooldown_s: float = 60.0,
+        adaptive_interval: bool = False,
+        max_concurrent_polls: int | None = None,
+        interval_jitter: float = 0.05,
     ) -> None:
-        _valid_policies = ("drop_oldest", "drop_new")
-        if drop_policy not in _valid_policies:
+        if drop_policy not in DROP_POLICIES:
             raise ValueError(
                 f"Invalid drop_policy={drop_policy!r}; "
-                f"must be one of {_valid_policies}"
+                f"must be one of {DROP_POLICIES}"
+            )
+        if not 0.0 <= interval_jitter < 1.0:
+            raise ValueError(
+                f"Invalid interval_jitter={interval_jitter!r}; "
+                "must be >= 0 and < 1"
+            )
+        if max_concurrent_polls is not None and max_concurrent_polls < 1:
+            raise ValueError(
+                f"Invalid max_concurrent_polls={max_concurrent_polls!r}; "
+                "must be >= 1 (or None for one thread per device)"
             )
         self._registry = registry
         self._fallback_sink = sink if sink is not None else _NoOpSink()
         self._connect = connect
         self._jitter_max = jitter_max
         self._queue_maxsize = queue_maxsize
+        self._queue_burst = queue_burst
         self._drop_policy = drop_policy
         self._reconnect_after_errors = reconnect_after_errors
         self._reconnect_cooldown_s = reconnect_cooldown_s
+        self._reconnect_max_cooldown_s = reconnect_max_cooldown_s
+        self._adaptive_interval = adaptive_interval
+        self._max_concurrent_polls = max_concurrent_polls
+        self._interval_jitter = interval_jitter
         self._metrics: dict[str, DeviceMetrics] = {
             r.device_id: DeviceMetrics(r.device_id) for r in registry
         }
         self._stop_event: asyncio.Event | None = None
+        # Resolved by stop() together with _stop_event; what the loops wait on
+        self._stop_future: asyncio.Future[None] | None = None
         self._tasks: list[asyncio.Task[None]] = []
         self._sink_tasks: list[asyncio.Task[None]] = []
-        self._queues: dict[str, asyncio.Queue] = {}  # type: ignore[type-arg]
+        self._queues: dict[str, SnapshotChannel] = {}
         self._push_adapters: dict[str, PushCallbackAdapter] = {}
+        self._poll_pool: ThreadPoolExecutor | None = None
         self._sink_closed = False
         self._active_sinks: list[Any] = []
         self._running = False
@@ -449,16 +654,55 @@ class Executor:
         self._sink_closed = False
         self._stop_event = asyncio.Event()
         self._push_adapters = {}
-
-        # Per-device bounded queues — created fresh per run() call
+        runtimes = tuple(self._registry)
+
+        # Devices writing to the same sink are drained by one shared worker:
+        # group them by sink identity, one wakeup event per group.
+        groups: dict[int, tuple[Any, asyncio.Event, list[str]]] = {}
+        for r in runtimes:
+            sink = self._registry.get_sink(r.device_id)
+            if sink is None:
+                sink = self._fallback_sink
+            group = groups.get(id(sink))
+            if group is None:
+                group = groups[id(sink)] = (sink, asyncio.Event(), [])
+            group[2].append(r.device_id)
+
+        # Per-device bounded channels — created fresh per run() call, each with
+        # its put() specialised to the drop policy.  Optional burst headroom is
+        # one pool shared by all of them, not queue_burst slots per device.
+        burst = BurstPool(self._queue_burst) if self._queue_burst > 0 else None
         self._queues = {
-            r.device_id: asyncio.Queue(maxsize=self._queue_maxsize)
-            for r in self._registry
+            device_id: SnapshotChannel(
+                self._metrics[device_id],
+                self._queue_maxsize,
+                self._drop_policy,
+                ready=ready,
+                burst=burst,
+            )
+            for _, ready, device_ids in groups.values()
+            for device_id in device_ids
         }
+        # Devices without a sink skip the hand-off entirely: no worker task,
+        # and put() discards.  Metrics are still recorded by the producer.
+        for sink, _, device_ids in groups.values():
+            if isinstance(sink, _NoOpSink):
+                for device_id in device_ids:
+                    self._queues[device_id].put = _discard
 
         # Device tasks — pull uses _device_loop; push uses _push_loop
         loop = asyncio.get_running_loop()
-        runtimes = list(self._registry)
+        _log_uvloop_hint(loop)
+        # One bounded pool for all blocking poll/reconnect calls of this run,
+        # instead of the loop's shared default executor.  Capping it below
+        # the device count queues excess polls instead of adding threads.
+        self._poll_pool = ThreadPoolExecutor(
+            max_workers=self._max_concurrent_polls or max(4, len(runtimes)),
+            thread_name_prefix="poll",
+        )
+        # A single stop future shared by every device loop — a plain Future
+        # resolved by stop(), so no Task sits waiting on the stop event.
+        stop_wait = self._stop_future = loop.create_future()
         self._tasks = []
         for runtime in runtimes:
             if runtime.mode == "push":
@@ -467,7 +711,6 @@ class Executor:
                     self._metrics[runtime.device_id],
                     self._queues[runtime.device_id],
                     loop,
-                    drop_policy=self._drop_policy,
                 )
                 self._push_adapters[runtime.device_id] = adapter
                 task = asyncio.create_task(
@@ -476,6 +719,7 @@ class Executor:
                         adapter,
                         self._stop_event,
                         connect=self._connect,
+                        stop_wait=stop_wait,
                     ),
                     name=f"push-loop-{runtime.device_id}",
                 )
@@ -488,77 +732,61 @@ class Executor:
                         self._queues[runtime.device_id],
                         connect=self._connect,
                         jitter_max=self._jitter_max,
-                        drop_policy=self._drop_policy,
                         reconnect_after_errors=self._reconnect_after_errors,
                         reconnect_cooldown_s=self._reconnect_cooldown_s,
+                        reconnect_max_cooldown_s=self._reconnect_max_cooldown_s,
+                        adaptive_interval=self._adaptive_interval,
+                        interval_jitter=self._interval_jitter,
+                        poll_pool=self._poll_pool,
+                        stop_wait=stop_wait,
                     ),
                     name=f"device-loop-{runtime.device_id}",
                 )
             else:
+                stop_wait.cancel()
                 raise RuntimeError(
                     f"Unrecognized mode: {runtime.mode!r} for device"
                     f" {runtime.device_id!r}"
                 )
+            # The channel closes after the producer's last snapshot, whether
+            # it stopped normally, crashed or was cancelled.
+            task.add_done_callback(
+                functools.partial(
+                    _on_producer_done,
+                    self._queues[runtime.device_id],
+                    runtime.device_id,
+                )
+            )
             self._tasks.append(task)
 
-        # Sink worker tasks — one per device, drains the queue
+        # Sink worker tasks — one per distinct sink, draining its devices
         self._active_sinks = []
         self._sink_tasks = []
-        for runtime, producer_task in zip(runtimes, self._tasks, strict=False):
-            sink = self._fallback_sink
-            configured = self._registry.get_sink(runtime.device_id)
-            if configured is not None:
-                sink = configured
+        for sink, _, device_ids in groups.values():
+            if isinstance(sink, _NoOpSink):
+                continue
             self._active_sinks.append(sink)
+            label = ",".join(device_ids)
             self._sink_tasks.append(
                 asyncio.create_task(
                     _sink_worker(
-                        runtime.device_id,
-                        self._queues[runtime.device_id],
-                        sink,
-                        self._stop_event,
-                        producer_task,
+                        label, [self._queues[d] for d in device_ids], sink
                     ),
-                    name=f"sink-worker-{runtime.device_id}",
+                    name=f"sink-worker-{label}",
                 )
             )
 
-        # Wait for all poll loops to finish
+        # Wait for poll loops and sink workers together — workers drain while
+        # producers are still tearing down, and exit once their channels close.
         try:
-            poll_results = await asyncio.gather(*self._tasks, return_exceptions=True)
-
-            # Log unexpected exceptions — do not lose them silently.
-            # Also cancel orphaned sink workers whose producer crashed: a crashed
-            # poll task leaves its sink worker spinning at 20 Hz on an empty queue
-            # until the global stop timeout.  Cancel it immediately so it does not
-            # burn CPU as an orphaned task.
-            for runtime, result, sink_task in zip(
-                runtimes, poll_results, self._sink_tasks, strict=False
-            ):
-                if isinstance(result, Exception) and not isinstance(
-                    result, asyncio.CancelledError
-                ):
-                    logger.error(
-                        "Device loop for %r raised unexpected exception: %s: %s",
-                        runtime.device_id,
-                        type(result).__name__,
-                        result,
-                    )
-                    if not sink_task.done():
-                        logger.warning(
-                            "Cancelling orphaned sink worker for %r"
-                            " (producer crashed)",
-                            runtime.device_id,
-                        )
-                        sink_task.cancel()
-
-            # Wait for sink workers to drain remaining queue items
-            sink_results = await asyncio.gather(
-                *self._sink_tasks, return_exceptions=True
+            results = await asyncio.gather(
+                *self._tasks, *self._sink_tasks, return_exceptions=True
             )
 
-            # Log unexpected sink worker exceptions — mirrors the poll task check above
-            for result in sink_results:
+            # Device loop crashes were logged by their done callback as they
+            # happened (which also closed the channel, so the sink worker
+            # drained what was queued and exited); sink workers are checked here.
+            for result in results[len(self._tasks) :]:
                 if isinstance(result, Exception) and not isinstance(
                     result, asyncio.CancelledError
                 ):
@@ -568,13 +796,22 @@ class Executor:
                         result,
                     )
         finally:
+            stop_wait.cancel()
+            self._shutdown_poll_pool()
             self._running = False
 
+    def _shutdown_poll_pool(self) -> None:
+        """Release the poll thread pool without waiting on hung transport calls."""
+        if self._poll_pool is not None:
+            self._poll_pool.shutdown(wait=False, cancel_futures=True)
+            self._poll_pool = None
+
     async def stop(self, timeout: float = 30.0) -> None:
         """Signal shutdown and wait up to timeout for tasks to complete.
 
         Shutdown order:
-          1. Set stop_event — poll loops and sink workers begin draining.
+          1. Set stop_event — producers exit, and each one's exit closes its
+             channel so the sink worker drains the rest and returns.
           2. Wait (up to timeout) for all tasks (poll + sink) to finish.
           3. Cancel any tasks still pending after the timeout.
           4. Await cancelled tasks to completion — this is required so that
@@ -582,9 +819,12 @@ class Executor:
              Calling sink.close() while a sink worker is still mid-write would
              race against an in-progress write on the same sink object.
           5. Only then call sink.close() on every active sink.
+          6. Shut down the poll thread pool.
         """
         if self._stop_event:
             self._stop_event.set()
+        if self._stop_future is not None and not self._stop_future.done():
+            self._stop_future.set_result(None)
         all_tasks = self._tasks + self._sink_tasks
         if all_tasks:
             _done, pending = await asyncio.wait(all_tasks, timeout=timeout)
@@ -606,8 +846,8 @@ class Executor:
                         asyncio.gather(*pending, return_exceptions=True),
                         timeout=min(5.0, timeout),
                     )
-                for device_id, queue in self._queues.items():
-                    remaining = queue.qsize()
+                for device_id, channel in self._queues.items():
+                    remaining = len(channel)
                     if remaining:
                         logger.warning(
                             "[%s] sink worker cancelled with %d snapshots unwritten",
@@ -617,12 +857,8 @@ class Executor:
         # sink.close() is called only after all sink worker tasks have exited
         # (either naturally or via the cancellation await above).
         if not self._sink_closed and self._stop_event is not None:
-            closed: set[int] = set()
+            # _active_sinks holds each distinct sink once (one per worker group)
             for sink in self._active_sinks or [self._fallback_sink]:
-                sink_id = id(sink)
-                if sink_id in closed:
-                    continue
-                closed.add(sink_id)
                 try:
                     await sink.close()
                 except Exception as exc:
@@ -632,6 +868,7 @@ class Executor:
                         exc,
                     )
             self._sink_closed = True
+        self._shutdown_poll_pool()
 
     async def __aenter__(self) -> Executor:
         return self
@@ -3,29 +3,36 @@
 Transport plugins call PushCallbackAdapter.on_data(raw) from any thread when
 the device publishes data.  The adapter decodes the payload, wraps it in a
 DeviceSnapshot, and schedules enqueueing on the asyncio event loop via
-call_soon_threadsafe — keeping all queue access on the event loop thread.
+call_soon_threadsafe — keeping all channel access on the event loop thread.
+Snapshots arriving while a hand-off is already scheduled ride along with it,
+so a burst costs one event loop wakeup rather than one per packet.
 """
 
 from __future__ import annotations
 
 import asyncio
 import logging
+import threading
 import time
+from collections import deque
 from collections.abc import Callable
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-from .device import DeviceRuntime, DeviceSnapshot
+from .device import _EMPTY_STATE, DeviceRuntime, DeviceSnapshot
+
+if TYPE_CHECKING:
+    from .channel import SnapshotChannel
 
 logger = logging.getLogger(__name__)
 
 
 class PushCallbackAdapter:
-    """Thread-safe bridge: transport push callback → DeviceSnapshot → async queue.
+    """Thread-safe bridge: transport push callback → DeviceSnapshot → channel.
 
     Usage::
 
         # Created by Executor for each push-mode device.
-        adapter = PushCallbackAdapter(runtime, metrics, queue, loop)
+        adapter = PushCallbackAdapter(runtime, metrics, channel, loop)
 
         # Transport plugin wires the callback (transport-specific):
         transport.set_on_data(adapter.on_data)
@@ -39,50 +46,65 @@ class PushCallbackAdapter:
     Args:
         runtime: DeviceRuntime owning this adapter.
         metrics: DeviceMetrics to update on each push event.
-        queue: Per-device bounded asyncio.Queue shared with sink worker.
+        channel: Per-device bounded SnapshotChannel shared with sink worker.
         loop: The running event loop to schedule on.
         decode_fn: Optional callable(raw) → state dict. Defaults to passthrough.
-        drop_policy: ``"drop_oldest"`` (default) or ``"drop_new"``.
     """
 
     def __init__(
         self,
         runtime: DeviceRuntime,
         metrics: Any,  # DeviceMetrics — runtime type; TYPE_CHECKING import above
-        queue: asyncio.Queue,  # type: ignore[type-arg]
+        channel: SnapshotChannel,
         loop: asyncio.AbstractEventLoop,
         *,
         decode_fn: Callable[[Any], dict[str, Any]] | None = None,
-        drop_policy: str = "drop_oldest",
     ) -> None:
         self._runtime = runtime
+        # Both fixed for the runtime's lifetime; cached for the on_data path.
+        self._device_id = runtime.device_id
+        self._model = runtime.model
         self._metrics = metrics
-        self._queue = queue
+        self._channel = channel
         self._loop = loop
+        # Bound once: _flush runs for every push burst.  Binding the
+        # channel's put() also picks up the Executor's no-sink discard.
+        self._record = metrics.record
+        self._put = channel.put
+        # Transport threads append, the event loop thread pops: deque
+        # append/popleft are atomic, so no lock is needed.  _flush_scheduled
+        # is True while a _flush callback is pending on the loop.
+        self._pending: deque[DeviceSnapshot] = deque()
+        self._flush_scheduled = False
+        # Serialises the loop-closed drop path across transport threads.
+        self._drop_lock = threading.Lock()
+        # Wall-clock minus monotonic: on_data reads only the monotonic clock
+        # and derives the snapshot timestamp from it.  Re-anchored on every
+        # _flush so NTP steps are picked up within one burst.
+        self._wall_offset = time.time() - time.monotonic()
         self._decode_fn: Callable[[Any], dict[str, Any]] = (
             decode_fn if decode_fn is not None else _default_decode
         )
-        self._drop_policy = drop_policy
 
     @property
     def device_id(self) -> str:
         """Device ID this adapter is bound to."""
-        return self._runtime.device_id
+        return self._device_id
 
     def on_data(self, raw: Any) -> None:
         """Feed raw push data. Thread-safe; may be called from any thread.
 
         Converts *raw* to a DeviceSnapshot via decode_fn and schedules it
-        to be enqueued into the device's queue on the event loop thread.
+        to be enqueued into the device's channel on the event loop thread.
         Errors in decode_fn are captured into an error snapshot (not raised).
         """
-        t = time.time()
         t0 = time.monotonic()
+        t = t0 + self._wall_offset
         try:
             state = self._decode_fn(raw)
             snapshot = DeviceSnapshot(
-                device_id=self._runtime.device_id,
-                model=self._runtime.client.profile.model,
+                device_id=self._device_id,
+                model=self._model,
                 timestamp=t,
                 state=state,
                 blocks_read=1,
@@ -91,47 +113,74 @@ class PushCallbackAdapter:
         except Exception as exc:
             logger.warning(
                 "[%s] push decode failed: %s: %s",
-                self._runtime.device_id,
+                self._device_id,
                 type(exc).__name__,
                 exc,
             )
             snapshot = DeviceSnapshot(
-                device_id=self._runtime.device_id,
-                model=self._runtime.client.profile.model,
+                device_id=self._device_id,
+                model=self._model,
                 timestamp=t,
-                state={},
+                state=_EMPTY_STATE,
                 blocks_read=0,
                 duration_ms=(time.monotonic() - t0) * 1000.0,
                 error=exc,
             )
+        self._pending.append(snapshot)
+        # Wake the loop only on the idle → pending transition.  Appending
+        # before reading the flag means a pending _flush always sees this
+        # snapshot: _flush clears the flag before it starts draining.
+        if self._flush_scheduled:
+            # A flush queued just before the loop stopped never runs; without
+            # this check the flag stays set and _pending grows unbounded.
+            if not self._loop.is_running():
+                self._drop_pending()
+            return
+        self._flush_scheduled = True
         try:
-            self._loop.call_soon_threadsafe(self._enqueue, snapshot)
+            self._loop.call_soon_threadsafe(self._flush)
         except RuntimeError:
+            self._drop_pending()
+
+    def _drop_pending(self) -> None:
+        """Discard and count pending snapshots once the loop can't take them.
+
+        Runs on a transport thread.  With the loop stopped no loop-thread code
+        writes ``dropped_snapshots`` any more, and the lock serialises the
+        transport threads, so the count is not lost.
+        """
+        pending = self._pending
+        dropped = 0
+        with self._drop_lock:
+            # Flag first: a snapshot appended after the drain below then
+            # schedules (and fails, and is counted) on its own, not stranded.
+            self._flush_scheduled = False
+            while pending:
+                pending.popleft()
+                dropped += 1
+            self._metrics.dropped_snapshots += dropped
+        if dropped:
             logger.warning(
-                "[%s] push: event loop closed/stopped, dropping snapshot",
-                self._runtime.device_id,
+                "[%s] push: event loop closed/stopped, dropped %d snapshot(s)",
+                self._device_id,
+                dropped,
             )
 
     # ------------------------------------------------------------------
     # Private — runs in event loop thread via call_soon_threadsafe
     # ------------------------------------------------------------------
 
-    def _enqueue(self, snapshot: DeviceSnapshot) -> None:
-        """Enqueue snapshot and update metrics. Runs in the event loop thread."""
-        self._metrics.record(snapshot)
-        if self._drop_policy == "drop_oldest":
-            if self._queue.full():
-                try:
-                    self._queue.get_nowait()
-                    self._metrics.dropped_snapshots += 1
-                except asyncio.QueueEmpty:
-                    pass
-            self._queue.put_nowait(snapshot)
-        else:  # drop_new
-            try:
-                self._queue.put_nowait(snapshot)
-            except asyncio.QueueFull:
-                self._metrics.dropped_snapshots += 1
+    def _flush(self) -> None:
+        """Enqueue pending snapshots and update metrics. Runs in the loop thread."""
+        self._flush_scheduled = False
+        self._wall_offset = time.time() - time.monotonic()
+        pending = self._pending
+        record = self._record
+        put = self._put
+        while pending:
+            snapshot = pending.popleft()
+            record(snapshot)
+            put(snapshot)
 
 
 def _default_decode(raw: Any) -> dict[str, Any]:
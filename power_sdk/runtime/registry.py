@@ -2,16 +2,24 @@
 
 from __future__ import annotations
 
+import asyncio
+import inspect
 import logging
 from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
-from ..bootstrap import build_client_from_entry, load_config, resolve_transport
+from ..bootstrap import (
+    build_client_from_entry,
+    clear_config_cache,
+    load_config,
+    resolve_transport,
+)
 from ..models.types import BlockGroup
 from ..plugins.registry import PluginRegistry, load_plugins
-from .config import parse_pipeline_specs, validate_runtime_config
+from .config import validate_runtime_config
 from .device import DeviceRuntime, DeviceSnapshot
 from .factory import StageResolver
 from .sink import Sink
@@ -19,10 +27,16 @@ from .sink_factory import build_sinks_from_config
 
 logger = logging.getLogger(__name__)
 
+# Thread cap for poll_all_once(): devices are polled concurrently, not in turn.
+_POLL_ALL_MAX_WORKERS = 32
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class DeviceSummary:
-    """Resolved pipeline info per device — used by --dry-run (no I/O)."""
+    """Resolved pipeline info per device — used by --dry-run (no I/O).
+
+    Slotted and frozen: a read-only record, safe to share and hash.
+    """
 
     device_id: str
     vendor: str
@@ -91,6 +105,13 @@ def _resolve_sink_for_device(
     return "memory", None
 
 
+# poll_groups entries match a BlockGroup value or name, case-insensitively.
+_POLL_GROUP_LOOKUP: dict[str, BlockGroup] = {
+    **{g.name.lower(): g for g in BlockGroup},
+    **{g.value.lower(): g for g in BlockGroup},
+}
+
+
 def _resolve_poll_groups(
     entry: dict[str, Any],
     defaults: dict[str, Any],
@@ -105,16 +126,11 @@ def _resolve_poll_groups(
     for item in raw:
         if not isinstance(item, str):
             raise ValueError("poll_groups entries must be strings")
-        try:
-            groups.append(BlockGroup(item.lower()))
-        except ValueError:
-            try:
-                groups.append(BlockGroup[item.upper()])
-            except KeyError as exc:
-                allowed = [g.value for g in BlockGroup]
-                raise ValueError(
-                    f"Unknown poll_group {item!r}; allowed: {allowed}"
-                ) from exc
+        group = _POLL_GROUP_LOOKUP.get(item.lower())
+        if group is None:
+            allowed = [g.value for g in BlockGroup]
+            raise ValueError(f"Unknown poll_group {item!r}; allowed: {allowed}")
+        groups.append(group)
     return tuple(groups)
 
 
@@ -137,22 +153,21 @@ def _validate_pipeline_stages(
 
 def _build_one_runtime(
     entry: dict[str, Any],
-    defaults: dict[str, Any],
-    pipeline_specs: dict[str, Any],
+    effective_defaults: dict[str, Any],
+    pspec: Any,
     sinks: dict[str, Sink],
     default_sink_name: str | None,
     reg: PluginRegistry,
 ) -> tuple[DeviceRuntime, Sink | None]:
     """Build a single DeviceRuntime from a device entry and resolved context.
 
+    effective_defaults is the pipeline's merged defaults (shared, read-only).
     Returns (runtime, sink_obj) where sink_obj is None when no named sink applies.
     """
     device_id = entry["id"]
 
     pname: str = entry["pipeline"]  # validate_runtime_config guarantees presence
-    pspec = pipeline_specs[pname]
     mode = pspec.mode
-    effective_defaults = _build_effective_defaults(defaults, pspec)
 
     vendor = _resolve(entry, effective_defaults, "vendor", "")
     protocol = _resolve(entry, effective_defaults, "protocol", "")
@@ -214,10 +229,12 @@ class RuntimeRegistry:
                 raise ValueError(f"Duplicate runtime device_id: {runtime.device_id!r}")
             seen_ids.add(runtime.device_id)
         self._runtimes: dict[str, DeviceRuntime] = {r.device_id: r for r in runtimes}
+        # Registry order, fixed after construction — what iteration walks.
+        self._ordered: tuple[DeviceRuntime, ...] = tuple(self._runtimes.values())
         self._sinks: dict[str, Sink] = sinks or {}
         self._device_sinks: dict[str, Sink] = device_sinks or {}
-        # Cached plugin registry — set by from_config() to avoid a redundant
-        # load_plugins() call when dry_run() is invoked on the same instance.
+        # Cached plugin registry — set by from_config() or the first dry_run()
+        # so later dry_run() calls on this instance skip load_plugins().
         self._plugin_registry: PluginRegistry | None = None
 
     @classmethod
@@ -232,11 +249,14 @@ class RuntimeRegistry:
         Referenced pipeline stage keys are validated via StageResolver
         before any client is built.
 
+        The parsed YAML is cached per file and reused while the file's mtime
+        and size are unchanged; env expansion and validation always re-run.
+
         Raises ValueError if the config fails validation.
         Raises RuntimeError if client construction fails for a device.
         """
         config = load_config(path)
-        validate_runtime_config(config)
+        pipeline_specs = validate_runtime_config(config)
 
         defaults = config.get("defaults", {})
         devices: list[dict[str, Any]] = config.get("devices", [])
@@ -244,15 +264,23 @@ class RuntimeRegistry:
 
         sinks = build_sinks_from_config(config.get("sinks", {}))
         default_sink_name: str | None = defaults.get("sink")
-        pipeline_specs = parse_pipeline_specs(config["pipelines"])
 
         _validate_pipeline_stages(pipeline_specs, devices, reg)
 
         runtimes: list[DeviceRuntime] = []
         device_sinks: dict[str, Sink] = {}
+        # Merged defaults depend only on the pipeline: built once per pipeline
+        # in use and shared by its devices, not copied per device.
+        effective_by_pipeline: dict[str, dict[str, Any]] = {}
         for entry in devices:
+            pname = entry["pipeline"]
+            pspec = pipeline_specs[pname]
+            effective_defaults = effective_by_pipeline.get(pname)
+            if effective_defaults is None:
+                effective_defaults = _build_effective_defaults(defaults, pspec)
+                effective_by_pipeline[pname] = effective_defaults
             runtime, sink_obj = _build_one_runtime(
-                entry, defaults, pipeline_specs, sinks, default_sink_name, reg
+                entry, effective_defaults, pspec, sinks, default_sink_name, reg
             )
             runtimes.append(runtime)
             if sink_obj is not None:
@@ -263,6 +291,11 @@ class RuntimeRegistry:
         instance._plugin_registry = reg
         return instance
 
+    @classmethod
+    def invalidate_config_cache(cls) -> None:
+        """Force the next from_config() to re-read its YAML file from disk."""
+        clear_config_cache()
+
     def get_sink(self, device_id: str) -> Sink | None:
         """Return the configured Sink for a device, or None if not configured."""
         return self._device_sinks.get(device_id)
@@ -272,11 +305,51 @@ class RuntimeRegistry:
         connect: bool = False,
         disconnect: bool = False,
     ) -> list[DeviceSnapshot]:
-        """Poll every device once. Errors are captured per-device, not raised."""
-        return [
-            r.poll_once(connect=connect, disconnect=disconnect)
-            for r in self._runtimes.values()
-        ]
+        """Poll every device once. Errors are captured per-device, not raised.
+
+        Devices are polled concurrently on a short-lived thread pool, so wall
+        time tracks the slowest device rather than the sum.  Snapshots are
+        returned in registry order.
+        """
+        runtimes = self._ordered
+        if len(runtimes) <= 1:
+            return [
+                r.poll_once(connect=connect, disconnect=disconnect) for r in runtimes
+            ]
+        with ThreadPoolExecutor(
+            max_workers=min(_POLL_ALL_MAX_WORKERS, len(runtimes)),
+            thread_name_prefix="poll-all",
+        ) as pool:
+            return list(
+                pool.map(
+                    lambda r: r.poll_once(connect=connect, disconnect=disconnect),
+                    runtimes,
+                )
+            )
+
+    async def poll_all_once_async(
+        self,
+        connect: bool = False,
+        disconnect: bool = False,
+    ) -> list[DeviceSnapshot]:
+        """Async poll_all_once(): poll every device concurrently from a loop.
+
+        Runtimes with an async-native ``poll_once_async(connect, disconnect)``
+        are awaited directly; the rest run poll_once() in the default executor.
+        Snapshots are returned in registry order.
+        """
+        polls = []
+        for r in self._ordered:
+            poll_once_async = getattr(r, "poll_once_async", None)
+            if inspect.iscoroutinefunction(poll_once_async):
+                polls.append(poll_once_async(connect, disconnect))
+            else:
+                polls.append(
+                    asyncio.to_thread(
+                        r.poll_once, connect=connect, disconnect=disconnect
+                    )
+                )
+        return list(await asyncio.gather(*polls))
 
     def dry_run(
         self,
@@ -286,9 +359,12 @@ class RuntimeRegistry:
 
         vendor/protocol taken from DeviceRuntime YAML context (not DeviceProfile).
         """
-        reg = plugin_registry or self._plugin_registry or load_plugins()
+        reg = plugin_registry or self._plugin_registry
+        if reg is None:
+            # Plugin discovery walks entry points: do it once per instance.
+            reg = self._plugin_registry = load_plugins()
         summaries: list[DeviceSummary] = []
-        for runtime in self._runtimes.values():
+        for runtime in self._ordered:
             manifest = reg.get(runtime.vendor, runtime.protocol)
             can_write = False
             if manifest is not None:
@@ -318,7 +394,7 @@ class RuntimeRegistry:
         return self._runtimes.get(device_id)
 
     def __iter__(self) -> Iterator[DeviceRuntime]:
-        return iter(self._runtimes.values())
+        return iter(self._ordered)
 
     def __len__(self) -> int:
-        return len(self._runtimes)
+        return len(self._ordered)
@@ -8,14 +8,82 @@ suppressed here — callers (Executor._device_loop) handle logging.
 from __future__ import annotations
 
 import asyncio
+import dataclasses
+import datetime
+import enum
+import json
+import math
 import sys
 import threading
+import uuid
 from collections import deque
+from collections.abc import Mapping, Sequence
 from pathlib import Path
-from typing import Protocol, runtime_checkable
+from typing import Any, Protocol, runtime_checkable
 
 from .device import DeviceSnapshot
 
+
+def _json_default(obj: Any) -> Any:
+    """Encode the non-JSON types orjson handles natively, the way it does."""
+    if isinstance(obj, (datetime.datetime, datetime.date, datetime.time)):
+        return obj.isoformat()
+    if isinstance(obj, uuid.UUID):
+        return str(obj)
+    if isinstance(obj, enum.Enum):
+        return obj.value
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        return {f.name: getattr(obj, f.name) for f in dataclasses.fields(obj)}
+    if hasattr(obj, "tolist") and type(obj).__module__ == "numpy":
+        return obj.tolist()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _finite(value: Any) -> Any:
+    """Copy of *value* with NaN/Infinity floats replaced by None (JSON null)."""
+    if isinstance(value, float):
+        return value if math.isfinite(value) else None
+    if isinstance(value, dict):
+        return {k: _finite(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_finite(v) for v in value]
+    return value
+
+
+def _encode_line_json(record: dict[str, Any]) -> bytes:
+    """Encode *record* as one UTF-8 JSON line with the stdlib encoder."""
+    try:
+        line = json.dumps(
+            record, ensure_ascii=False, allow_nan=False, default=_json_default
+        )
+    except ValueError:
+        # Non-finite floats: write null, as orjson does, never bare NaN
+        line = json.dumps(
+            _finite(record), ensure_ascii=False, allow_nan=False, default=_json_default
+        )
+    return (line + "\n").encode("utf-8")
+
+
+try:
+    import orjson
+except ImportError:  # optional speedup: pip install power-sdk[orjson]
+    _encode_line = _encode_line_json
+else:
+
+    def _encode_line_orjson(record: dict[str, Any]) -> bytes:
+        """Encode *record* as one UTF-8 JSON line with orjson."""
+        # NON_STR_KEYS: stringify non-str state keys like the stdlib does
+        return orjson.dumps(
+            record,
+            default=_json_default,
+            option=orjson.OPT_APPEND_NEWLINE
+            | orjson.OPT_NON_STR_KEYS
+            | orjson.OPT_SERIALIZE_NUMPY,
+        )
+
+    _encode_line = _encode_line_orjson
+
+
 # ---------------------------------------------------------------------------
 # Protocol
 # ---------------------------------------------------------------------------
@@ -23,7 +91,12 @@ from .device import DeviceSnapshot
 
 @runtime_checkable
 class Sink(Protocol):
-    """Post-poll sink contract."""
+    """Post-poll sink contract.
+
+    Sinks may additionally define ``async write_many(snapshots)`` taking a
+    sequence of snapshots in queue order; the Executor's sink worker uses it
+    for batches drained in one go and falls back to write() otherwise.
+    """
 
     async def write(self, snapshot: DeviceSnapshot) -> None:
         """Receive one snapshot after a poll cycle."""
@@ -48,12 +121,34 @@ class MemorySink:
 
     def __init__(self, maxlen: int = 100) -> None:
         self._store: dict[str, deque[DeviceSnapshot]] = {}
+        # Error snapshots currently retained per device, kept in step with the
+        # rings so ok_count()/error_count() need no scan.
+        self._errors: dict[str, int] = {}
         self._maxlen = maxlen
 
     async def write(self, snapshot: DeviceSnapshot) -> None:
-        if snapshot.device_id not in self._store:
-            self._store[snapshot.device_id] = deque(maxlen=self._maxlen)
-        self._store[snapshot.device_id].append(snapshot)
+        self._append(snapshot)
+
+    async def write_many(self, snapshots: Sequence[DeviceSnapshot]) -> None:
+        for snapshot in snapshots:
+            self._append(snapshot)
+
+    def _append(self, snapshot: DeviceSnapshot) -> None:
+        # One dict probe per snapshot once the device's ring exists.  Not
+        # setdefault(): that would build a throwaway deque on every call.
+        device_id = snapshot.device_id
+        ring = self._store.get(device_id)
+        if ring is None:
+            ring = self._store[device_id] = deque(maxlen=self._maxlen)
+        if not self._maxlen:
+            return  # a zero-length ring retains nothing
+        # The error tally is only touched when an error snapshot enters or
+        # is about to be evicted from a full ring.
+        if len(ring) == self._maxlen and ring[0].error is not None:
+            self._errors[device_id] -= 1
+        if snapshot.error is not None:
+            self._errors[device_id] = self._errors.get(device_id, 0) + 1
+        ring.append(snapshot)
 
     async def close(self) -> None:
         pass  # nothing to flush
@@ -72,10 +167,11 @@ class MemorySink:
         return {did: q[-1] for did, q in self._store.items() if q}
 
     def ok_count(self, device_id: str) -> int:
-        return sum(1 for s in self._store.get(device_id, []) if s.ok)
+        ring = self._store.get(device_id)
+        return len(ring) - self._errors.get(device_id, 0) if ring else 0
 
     def error_count(self, device_id: str) -> int:
-        return sum(1 for s in self._store.get(device_id, []) if not s.ok)
+        return self._errors.get(device_id, 0)
 
 
 # ---------------------------------------------------------------------------
@@ -88,7 +184,7 @@ _SENSITIVE_FIELDS = frozenset({
 })
 
 
-def _redact_state(state: dict) -> dict:
+def _redact_state(state: Mapping[str, Any]) -> dict[str, Any]:
     """Redact known sensitive fields before sink output."""
     return {
         k: "<redacted>" if k in _SENSITIVE_FIELDS else v
@@ -106,6 +202,8 @@ class JsonlSink:
 
     Thread-safe: threading.Lock prevents line interleaving when multiple
     device loops call _append() concurrently via asyncio.to_thread().
+    JSON encoding happens in that same worker thread, so serialization
+    never runs on the event loop (snapshots are immutable, so this is safe).
     """
 
     def __init__(self, path: str | Path) -> None:
@@ -113,8 +211,37 @@ class JsonlSink:
         self._lock = threading.Lock()
 
     async def write(self, snapshot: DeviceSnapshot) -> None:
-        import json
+        await asyncio.to_thread(self._append_snapshots, (snapshot,))
+
+    async def write_many(self, snapshots: Sequence[DeviceSnapshot]) -> None:
+        """Encode and append all snapshots with a single thread hop."""
+        if not snapshots:
+            return
+        await asyncio.to_thread(self._append_snapshots, snapshots)
+
+    def _append_snapshots(self, snapshots: Sequence[DeviceSnapshot]) -> None:
+        # Each snapshot is encoded on its own: a batch can hold several
+        # devices, and one unencodable state must not cost the others' lines.
+        lines: list[bytes] = []
+        failed: list[tuple[str, Exception]] = []
+        for snapshot in snapshots:
+            try:
+                lines.append(self._format(snapshot))
+            except Exception as exc:
+                failed.append((snapshot.device_id, exc))
+        if lines:
+            self._append(b"".join(lines))
+        if failed:
+            details = "; ".join(
+                f"{device_id}: {type(exc).__name__}: {exc}"
+                for device_id, exc in failed
+            )
+            raise RuntimeError(
+                f"JsonlSink could not encode {len(failed)} snapshot(s): {details}"
+            ) from failed[0][1]
 
+    @staticmethod
+    def _format(snapshot: DeviceSnapshot) -> bytes:
         record = {
             "device_id": snapshot.device_id,
             "model": snapshot.model,
@@ -125,12 +252,11 @@ class JsonlSink:
             "state": _redact_state(snapshot.state),
             "error": str(snapshot.error) if snapshot.error else None,
         }
-        line = json.dumps(record, ensure_ascii=False)
-        await asyncio.to_thread(self._append, line)
+        return _encode_line(record)
 
-    def _append(self, line: str) -> None:
-        with self._lock, open(self._path, "a", encoding="utf-8") as f:
-            f.write(line + "\n")
+    def _append(self, data: bytes) -> None:
+        with self._lock, open(self._path, "ab") as f:
+            f.write(data)
 
     async def close(self) -> None:
         pass
@@ -142,9 +268,10 @@ class JsonlSink:
 
 
 class CompositeSink:
-    """Fans out to multiple sinks sequentially.
+    """Fans out to multiple sinks concurrently.
 
-    If one sink raises, subsequent sinks still receive the snapshot
+    Every sink receives the snapshot even if another raises; per-sink order
+    is preserved, and latency is that of the slowest sink rather than the sum
     (errors are NOT suppressed — caller handles logging).
     """
 
@@ -152,25 +279,61 @@ class CompositeSink:
         self._sinks = sinks
 
     async def write(self, snapshot: DeviceSnapshot) -> None:
-        errors: list[Exception] = []
-        for sink in self._sinks:
+        results = await asyncio.gather(
+            *(sink.write(snapshot) for sink in self._sinks), return_exceptions=True
+        )
+        self._raise_errors("write", results)
+
+    async def write_many(self, snapshots: Sequence[DeviceSnapshot]) -> None:
+        """Hand the batch to each sink — via its write_many() when it has one."""
+        results = await asyncio.gather(
+            *(self._write_batch(sink, snapshots) for sink in self._sinks),
+            return_exceptions=True,
+        )
+        self._raise_errors("write_many", results)
+
+    @staticmethod
+    async def _write_batch(sink: Sink, snapshots: Sequence[DeviceSnapshot]) -> None:
+        write_many = getattr(sink, "write_many", None)
+        if write_many is not None:
+            await write_many(snapshots)
+            return
+        # Every snapshot is still offered; report one error per sink.
+        first_exc: Exception | None = None
+        for snapshot in snapshots:
             try:
                 await sink.write(snapshot)
             except Exception as _sink_exc:
-                errors.append(_sink_exc)
+                first_exc = first_exc or _sink_exc
+        if first_exc is not None:
+            raise first_exc
+
+    @classmethod
+    def _raise_errors(cls, method: str, results: Sequence[object]) -> None:
+        """Raise the aggregated sink errors from a gather(), in sink order."""
+        errors: list[Exception] = []
+        for result in results:
+            if isinstance(result, Exception):
+                errors.append(result)
+            elif isinstance(result, BaseException):
+                raise result  # e.g. a sink cancelled on its own
         if errors:
-            details = "; ".join(f"{type(e).__name__}: {e}" for e in errors)
-            agg = RuntimeError(
-                f"CompositeSink.write failed in {len(errors)} sink(s): {details}"
-            )
-            agg.__cause__ = errors[0]
-            # __notes__ (PEP 678) is only available on Python 3.11+;
-            # on 3.10 the attribute assignment would be silently ignored.
-            if len(errors) > 1 and sys.version_info >= (3, 11):
-                agg.__notes__ = [
-                    f"Additional: {type(e).__name__}: {e}" for e in errors[1:]
-                ]
-            raise agg
+            raise cls._aggregate(method, errors)
+
+    @staticmethod
+    def _aggregate(method: str, errors: list[Exception]) -> RuntimeError:
+        details = "; ".join(f"{type(e).__name__}: {e}" for e in errors)
+        agg = RuntimeError(
+            f"CompositeSink.{method} failed in {len(errors)} sink(s): {details}"
+        )
+        agg.__cause__ = errors[0]
+        # __notes__ (PEP 678) is only available on Python 3.11+;
+        # on 3.10 the attribute assignment would be silently ignored.
+        if len(errors) > 1 and sys.version_info >= (3, 11):
+            agg.__notes__ = [
+                f"Additional: {type(e).__name__}: {e}" for e in errors[1:]
+            ]
+        return agg
 
     async def close(self) -> None:
         errors: list[Exception] = []
@@ -42,11 +42,11 @@ import os
 import re
 import ssl
 import stat
+import tempfile
 import time
 import uuid
 import weakref
 from dataclasses import dataclass, field
-from pathlib import Path
 from threading import Event, Lock
 from typing import Any
 
@@ -474,9 +474,8 @@ class MQTTTransport(TransportProtocol):
 
             from cryptography.hazmat.primitives import serialization
 
-            # Create private temp directory explicitly under an SDK-owned root.
-            # tempfile.mkdtemp() can produce unwritable dirs under restrictive
-            # Windows ACL inheritance in some environments.
+            # Create private temp directory (owner-only) outside the working
+            # directory, so key material never lands in a project checkout.
             self._temp_cert_dir = self._create_private_temp_dir()
             logger.debug(f"Created private temp directory: {self._temp_cert_dir}")
 
@@ -597,13 +596,8 @@ class MQTTTransport(TransportProtocol):
 
     @staticmethod
     def _create_private_temp_dir() -> str:
-        """Create per-connection private temp directory under a stable root."""
-        root = Path.cwd() / ".power_sdk_tls_tmp"
-        root.mkdir(parents=True, exist_ok=True)
-
-        path = root / f"tls_{uuid.uuid4().hex}"
-        path.mkdir(parents=False, exist_ok=False)
-        return str(path)
+        """Create per-connection private temp directory in the system temp dir."""
+        return tempfile.mkdtemp(prefix="power_sdk_tls_")
 
     def _cleanup_certs(self) -> None:
         """Clean up temporary certificate directory and files.
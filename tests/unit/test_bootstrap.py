@@ -9,6 +9,7 @@ from unittest.mock import Mock
 import pytest
 from power_sdk.bootstrap import (
     build_client_from_entry,
+    clear_config_cache,
     load_config,
 )
 from power_sdk.devices.types import BlockGroupDefinition, DeviceProfile
@@ -207,6 +208,35 @@ devices:
         path.unlink(missing_ok=True)
 
 
+def test_load_config_reuses_parse_until_file_changes(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    import os
+
+    import yaml
+
+    path = tmp_path / "devices.yaml"
+    path.write_text(SAMPLE_YAML, encoding="utf-8")
+    parses = Mock(side_effect=yaml.safe_load)
+    monkeypatch.setattr("power_sdk.bootstrap.yaml.safe_load", parses)
+    clear_config_cache()
+
+    first = load_config(path)
+    first["devices"].clear()  # callers get fresh containers, not the cache
+    assert load_config(path)["devices"][0]["id"] == "dev-1"
+    assert parses.call_count == 1
+
+    path.write_text(SAMPLE_YAML.replace("dev-1", "dev-2"), encoding="utf-8")
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+    assert load_config(path)["devices"][0]["id"] == "dev-2"
+    assert parses.call_count == 2
+
+    clear_config_cache()
+    load_config(path)
+    assert parses.call_count == 3
+
+
 def test_build_client_from_entry_uses_registry(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
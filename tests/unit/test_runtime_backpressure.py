@@ -146,3 +146,28 @@ async def test_dropped_snapshots_counter_increments() -> None:
     assert m is not None
     # With queue_maxsize=1 and many fast polls, many drops expected
     assert m.dropped_snapshots >= 1
+
+
+@pytest.mark.asyncio
+async def test_queue_burst_defers_drops() -> None:
+    """Shared burst slots are used up before the drop policy discards."""
+    runtime = make_device_runtime(poll_interval=0.005)
+    executor = Executor(
+        make_registry(runtime),
+        sink=_SlowSink(delay=2.0),
+        connect=False,
+        jitter_max=0.0,
+        queue_maxsize=2,
+        queue_burst=100,
+    )
+    run_task = asyncio.create_task(executor.run())
+    await asyncio.sleep(0.08)
+    channel = executor._queues["dev1"]
+    assert len(channel) > 2
+    await executor.stop(timeout=0.1)  # do not wait for the slow sink to drain
+    await run_task
+
+    m = executor.metrics("dev1")
+    assert m is not None
+    assert m.poll_ok >= 5
+    assert m.dropped_snapshots == 0
@@ -0,0 +1,140 @@
+"""Tests for SnapshotChannel — the per-device producer → sink worker hand-off."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+from power_sdk.runtime.channel import BurstPool, SnapshotChannel
+from power_sdk.runtime.device import DeviceSnapshot
+from power_sdk.runtime.loop import DeviceMetrics
+
+
+def _snap(n: int) -> DeviceSnapshot:
+    return DeviceSnapshot(
+        device_id="dev1", model="M", timestamp=float(n), state={}, blocks_read=1
+    )
+
+
+def _timestamps(items: list[DeviceSnapshot]) -> list[float]:
+    return [s.timestamp for s in items]
+
+
+def test_drop_oldest_evicts_head_and_counts() -> None:
+    metrics = DeviceMetrics(device_id="dev1")
+    channel = SnapshotChannel(metrics, 2, "drop_oldest")
+    for n in range(4):
+        channel.put(_snap(n))
+    assert metrics.dropped_snapshots == 2
+    assert _timestamps(channel.drain_all()) == [2.0, 3.0]
+
+
+def test_drop_oldest_burst_keeps_newest_window() -> None:
+    metrics = DeviceMetrics(device_id="dev1")
+    channel = SnapshotChannel(metrics, 3, "drop_oldest")
+    for n in range(10_000):
+        channel.put(_snap(n))
+    assert len(channel) == 3
+    assert metrics.dropped_snapshots == 9_997
+    assert _timestamps(channel.take(64)) == [9_997.0, 9_998.0, 9_999.0]
+
+
+def test_drop_new_discards_incoming_and_counts() -> None:
+    metrics = DeviceMetrics(device_id="dev1")
+    channel = SnapshotChannel(metrics, 2, "drop_new")
+    for n in range(4):
+        channel.put(_snap(n))
+    assert metrics.dropped_snapshots == 2
+    assert _timestamps(channel.drain_all()) == [0.0, 1.0]
+
+
+def test_non_positive_maxsize_is_unbounded() -> None:
+    metrics = DeviceMetrics(device_id="dev1")
+    channel = SnapshotChannel(metrics, 0, "drop_new")
+    for n in range(500):
+        channel.put(_snap(n))
+    assert not channel.full()
+    assert len(channel) == 500
+    assert metrics.dropped_snapshots == 0
+
+
+@pytest.mark.asyncio
+async def test_get_batch_waits_for_put_and_respects_limit() -> None:
+    channel = SnapshotChannel(DeviceMetrics(device_id="dev1"), 10)
+    waiter = asyncio.create_task(channel.get_batch(2))
+    await asyncio.sleep(0)
+    assert not waiter.done()
+
+    for n in range(3):
+        channel.put(_snap(n))
+    assert _timestamps(await waiter) == [0.0, 1.0]
+    assert _timestamps(await channel.get_batch(2)) == [2.0]
+
+
+@pytest.mark.asyncio
+async def test_close_wakes_consumer_after_drain() -> None:
+    channel = SnapshotChannel(DeviceMetrics(device_id="dev1"), 10)
+    channel.put(_snap(0))
+    channel.close()
+    assert _timestamps(await channel.get_batch(64)) == [0.0]
+    assert await channel.get_batch(64) == []
+
+    idle = SnapshotChannel(DeviceMetrics(device_id="dev1"), 10)
+    waiter = asyncio.create_task(idle.get_batch(64))
+    await asyncio.sleep(0)
+    idle.close()
+    assert await asyncio.wait_for(waiter, timeout=1.0) == []
+
+
+def test_unknown_drop_policy_rejected() -> None:
+    with pytest.raises(ValueError, match="drop_policy"):
+        SnapshotChannel(DeviceMetrics(device_id="dev1"), 2, "drop_random")
+
+
+@pytest.mark.asyncio
+async def test_shared_ready_event_wakes_on_any_channel() -> None:
+    ready = asyncio.Event()
+    first = SnapshotChannel(DeviceMetrics(device_id="dev1"), ready=ready)
+    second = SnapshotChannel(DeviceMetrics(device_id="dev2"), ready=ready)
+    waiter = asyncio.create_task(first.wait())
+    await asyncio.sleep(0)
+    assert not waiter.done()
+
+    second.put(_snap(0))
+    await asyncio.wait_for(waiter, timeout=1.0)
+    assert first.take(64) == []
+    assert _timestamps(second.take(64)) == [0.0]
+
+
+@pytest.mark.parametrize("policy", ["drop_oldest", "drop_new"])
+def test_burst_pool_absorbs_overflow_then_returns_slots(policy: str) -> None:
+    pool = BurstPool(3)
+    m1, m2 = DeviceMetrics(device_id="dev1"), DeviceMetrics(device_id="dev2")
+    first = SnapshotChannel(m1, 2, policy, burst=pool)
+    second = SnapshotChannel(m2, 2, policy, burst=pool)
+
+    for n in range(4):
+        first.put(_snap(n))
+    assert m1.dropped_snapshots == 0
+    assert pool.free == 1
+
+    for n in range(4):
+        second.put(_snap(n))  # only one shared slot left
+    assert m2.dropped_snapshots == 1
+    assert pool.free == 0
+    assert first.full() and second.full()
+
+    assert _timestamps(first.take(3)) == [0.0, 1.0, 2.0]
+    assert pool.free == 2  # back under maxsize: both borrowed slots returned
+    assert len(second) == 3
+    second.drain_all()
+    assert pool.free == 3
+
+
+def test_burst_pool_ignored_for_unbounded_channel() -> None:
+    pool = BurstPool(3)
+    channel = SnapshotChannel(DeviceMetrics(device_id="dev1"), 0, burst=pool)
+    for n in range(10):
+        channel.put(_snap(n))
+    assert len(channel) == 10
+    assert pool.free == 3
@@ -70,6 +70,14 @@ class TestParseSinkSpecs:
         spec = parse_sink_specs({"c": {"type": "composite", "sinks": ["a", "b"]}})["c"]
         assert spec.sub_sinks == ["a", "b"]
 
+    def test_composite_sub_sinks_copied_and_coerced(self) -> None:
+        names = ["a", "b"]
+        spec = parse_sink_specs({"c": {"type": "composite", "sinks": names}})["c"]
+        assert spec.sub_sinks == names
+        assert spec.sub_sinks is not names
+        spec = parse_sink_specs({"c": {"type": "composite", "sinks": ["a", 2]}})["c"]
+        assert spec.sub_sinks == ["a", "2"]
+
     def test_composite_empty_sinks_raises(self) -> None:
         with pytest.raises(ValueError, match="sinks"):
             parse_sink_specs({"c": {"type": "composite", "sinks": []}})
@@ -82,6 +90,10 @@ class TestParseSinkSpecs:
         with pytest.raises(ValueError, match="invalid"):
             parse_sink_specs({"bad": {"type": "kafka"}})
 
+    def test_non_string_type_raises(self) -> None:
+        with pytest.raises(ValueError, match="invalid"):
+            parse_sink_specs({"bad": {"type": ["memory"]}})
+
     def test_non_dict_raw_raises(self) -> None:
         with pytest.raises(ValueError):
             parse_sink_specs({"bad": "just a string"})
@@ -190,6 +202,46 @@ class TestSinksValidation:
                 )
             )
 
+    def test_composite_cycle_message_follows_real_edges(self) -> None:
+        # Discovery order is a, b, c but there is no b -> c reference
+        with pytest.raises(ValueError) as exc_info:
+            validate_runtime_config(
+                _base_config(
+                    sinks={
+                        "a": {"type": "composite", "sinks": ["b", "c"]},
+                        "b": {"type": "composite", "sinks": ["a"]},
+                        "c": {"type": "composite", "sinks": ["a"]},
+                    }
+                )
+            )
+        lines = str(exc_info.value).splitlines()
+        assert "Cycle detected in composite sinks: a -> b -> a" in lines
+        assert "b -> c" not in str(exc_info.value)
+
+    def test_every_composite_cycle_reported(self) -> None:
+        with pytest.raises(ValueError) as exc_info:
+            validate_runtime_config(
+                _base_config(
+                    sinks={
+                        "a": {"type": "composite", "sinks": ["b"]},
+                        "b": {"type": "composite", "sinks": ["a"]},
+                        "c": {"type": "composite", "sinks": ["c", "mem"]},
+                        "mem": {"type": "memory"},
+                    }
+                )
+            )
+        lines = str(exc_info.value).splitlines()
+        assert "Cycle detected in composite sinks: a -> b -> a" in lines
+        assert "Cycle detected in composite sinks: c -> c" in lines
+
+    def test_composite_nesting_too_deep_raises(self) -> None:
+        sinks = {
+            f"s{i}": {"type": "composite", "sinks": [f"s{i + 1}"]} for i in range(60)
+        }
+        sinks["s60"] = {"type": "memory"}
+        with pytest.raises(ValueError, match="nesting depth exceeds"):
+            validate_runtime_config(_base_config(sinks=sinks))
+
 
 # ---------------------------------------------------------------------------
 # validate_runtime_config — defaults.sink
@@ -282,6 +334,24 @@ class TestPollIntervalValidation:
         }
         validate_runtime_config(config)
 
+    def test_invalid_defaults_poll_interval_reported_on_inheriting_device(
+        self,
+    ) -> None:
+        config = _base_config(
+            defaults={"poll_interval": "fast"},
+            devices=[
+                {
+                    "id": "dev1",
+                    "profile_id": "DEV1",
+                    "pipeline": "default_pipe",
+                    "poll_interval": 5,
+                },
+                {"id": "dev2", "profile_id": "DEV2", "pipeline": "default_pipe"},
+            ],
+        )
+        with pytest.raises(ValueError, match=r"devices\[1\]\.poll_interval"):
+            validate_runtime_config(config)
+
 
 # ---------------------------------------------------------------------------
 # validate_runtime_config — per-device sink ref
@@ -410,6 +480,12 @@ class TestPipelineRefValidation:
         }
         validate_runtime_config(config)  # should not raise
 
+    def test_returns_parsed_pipeline_specs(self) -> None:
+        specs = validate_runtime_config(_base_config())
+        assert list(specs) == ["default_pipe"]
+        assert specs["default_pipe"].vendor == "acme"
+        assert specs["default_pipe"].transport == "stub"
+
     def test_device_without_pipeline_raises(self) -> None:
         """Device that does not reference a pipeline is rejected."""
         config = {
@@ -480,3 +556,64 @@ class TestPipelineRefValidation:
         }
         with pytest.raises(ValueError, match=r"devices\[0\]: 'pipeline' is required"):
             validate_runtime_config(config)
+
+
+# ---------------------------------------------------------------------------
+# Error collection
+# ---------------------------------------------------------------------------
+
+
+class TestCollectedErrors:
+    def test_all_device_errors_reported_together(self) -> None:
+        config = _base_config(
+            devices=[
+                {"id": "", "profile_id": "DEV1", "pipeline": "default_pipe"},
+                {
+                    "id": "dev2",
+                    "profile_id": "DEV2",
+                    "pipeline": "ghost",
+                    "poll_interval": 0,
+                },
+                {"id": "dev3", "profile_id": "DEV3", "pipeline": "default_pipe"},
+            ]
+        )
+        with pytest.raises(ValueError) as exc_info:
+            validate_runtime_config(config)
+        lines = str(exc_info.value).splitlines()
+        assert len(lines) == 3
+        assert lines[0].startswith("devices[0]: 'id'")
+        assert lines[1].startswith("devices[1].poll_interval")
+        assert lines[2].startswith("devices[1].pipeline='ghost'")
+
+    def test_sink_and_device_errors_reported_together(self) -> None:
+        config = _base_config(
+            sinks={"fan": {"type": "composite", "sinks": ["nope"]}},
+            defaults={"sink": "missing"},
+        )
+        with pytest.raises(ValueError) as exc_info:
+            validate_runtime_config(config)
+        message = str(exc_info.value)
+        assert "references unknown sink 'nope'" in message
+        assert "defaults.sink='missing'" in message
+        assert "devices[0].sink" not in message  # inherited: reported once
+
+    def test_bad_default_sink_reported_once_for_inheriting_devices(self) -> None:
+        config = _base_config(
+            sinks={"mem": {"type": "memory"}},
+            defaults={"sink": "typo"},
+            devices=[
+                {"id": "dev1", "profile_id": "DEV1", "pipeline": "default_pipe"},
+                {"id": "dev2", "profile_id": "DEV2", "pipeline": "default_pipe"},
+            ],
+        )
+        with pytest.raises(ValueError) as exc_info:
+            validate_runtime_config(config)
+        assert str(exc_info.value).splitlines() == [
+            "defaults.sink='typo' is not defined in 'sinks' section"
+        ]
+
+    def test_version_mismatch_still_fails_fast(self) -> None:
+        config = _base_config(version=2, devices=[{"id": ""}])
+        with pytest.raises(ValueError) as exc_info:
+            validate_runtime_config(config)
+        assert "\n" not in str(exc_info.value)
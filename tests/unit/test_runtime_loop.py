@@ -6,6 +6,7 @@ import asyncio
 
 import pytest
 from power_sdk.runtime import Executor
+from power_sdk.runtime.channel import SnapshotChannel
 
 from tests.helpers import make_device_runtime, make_registry
 
@@ -76,6 +77,332 @@ async def test_device_metrics_updated_on_ok():
     assert m.last_ok_at is not None
 
 
+@pytest.mark.asyncio
+async def test_polls_run_on_executor_owned_thread_pool():
+    import threading
+
+    threads: list[str] = []
+    runtime = make_device_runtime(poll_interval=0.01)
+    runtime.client.get_device_state.side_effect = lambda: (
+        threads.append(threading.current_thread().name) or {}
+    )
+    executor = Executor(make_registry(runtime), connect=False, jitter_max=0.0)
+    run_task = asyncio.create_task(executor.run())
+    await asyncio.sleep(0.04)
+    pool = executor._poll_pool
+    assert pool is not None
+    await executor.stop()
+    await run_task
+
+    assert threads
+    assert all(name.startswith("poll") for name in threads)
+    assert executor._poll_pool is None
+    assert pool._shutdown
+
+
+@pytest.mark.asyncio
+async def test_max_concurrent_polls_caps_poll_threads():
+    import threading
+
+    threads: set[str] = set()
+    runtimes = [
+        make_device_runtime(device_id=f"dev{n}", poll_interval=0.01) for n in range(6)
+    ]
+    for runtime in runtimes:
+        runtime.client.get_device_state.side_effect = lambda: (
+            threads.add(threading.current_thread().name) or {}
+        )
+    executor = Executor(
+        make_registry(*runtimes),
+        connect=False,
+        jitter_max=0.0,
+        max_concurrent_polls=2,
+    )
+    run_task = asyncio.create_task(executor.run())
+    await asyncio.sleep(0.05)
+    await executor.stop()
+    await run_task
+
+    assert 1 <= len(threads) <= 2
+    for runtime in runtimes:
+        m = executor.metrics(runtime.device_id)
+        assert m is not None and m.poll_ok >= 1
+
+
+def test_max_concurrent_polls_must_be_positive():
+    with pytest.raises(ValueError, match="max_concurrent_polls"):
+        Executor(make_registry(make_device_runtime()), max_concurrent_polls=0)
+
+
+@pytest.mark.asyncio
+async def test_device_loop_creates_one_stop_waiter_for_all_cycles():
+    from power_sdk.runtime.loop import DeviceMetrics, _device_loop
+
+    runtime = make_device_runtime(poll_interval=0.005)
+    stop_event = asyncio.Event()
+    original_wait = stop_event.wait
+    waits = 0
+
+    async def counting_wait() -> bool:
+        nonlocal waits
+        waits += 1
+        return await original_wait()
+
+    stop_event.wait = counting_wait  # type: ignore[method-assign]
+    metrics = DeviceMetrics(device_id="dev1")
+    task = asyncio.create_task(
+        _device_loop(
+            runtime,
+            metrics,
+            stop_event,
+            SnapshotChannel(metrics, 100),
+            connect=False,
+            jitter_max=0.0,
+            reconnect_after_errors=0,
+            reconnect_cooldown_s=0.0,
+        )
+    )
+    await asyncio.sleep(0.05)
+    stop_event.set()
+    await asyncio.wait_for(task, timeout=1.0)
+
+    assert metrics.poll_ok >= 3
+    assert waits == 1
+
+
+@pytest.mark.asyncio
+async def test_executor_loops_share_one_stop_waiter():
+    runtimes = [
+        make_device_runtime(device_id=d, poll_interval=0.005)
+        for d in ("dev1", "dev2", "dev3")
+    ]
+    executor = Executor(make_registry(*runtimes), connect=False, jitter_max=0.0)
+    waits = 0
+
+    run_task = asyncio.create_task(executor.run())
+    await asyncio.sleep(0)
+    assert executor._stop_event is not None
+    original_wait = executor._stop_event.wait
+
+    async def counting_wait() -> bool:
+        nonlocal waits
+        waits += 1
+        return await original_wait()
+
+    executor._stop_event.wait = counting_wait  # type: ignore[method-assign]
+    await asyncio.sleep(0.03)
+    await executor.stop(timeout=2.0)
+    await run_task
+
+    # Every loop waited on the Executor's stop future, a plain Future that
+    # stop() resolves — nothing called stop_event.wait().
+    assert waits == 0
+    assert executor._stop_future is not None
+    assert not isinstance(executor._stop_future, asyncio.Task)
+    for device_id in ("dev1", "dev2", "dev3"):
+        m = executor.metrics(device_id)
+        assert m is not None and m.poll_ok >= 2
+
+
+@pytest.mark.asyncio
+async def test_poll_duration_does_not_drift_schedule():
+    """Polls start on a fixed-rate grid even when each poll takes a while."""
+    import time
+    from itertools import pairwise
+
+    starts: list[float] = []
+
+    def slow_state() -> dict:
+        starts.append(time.monotonic())
+        time.sleep(0.03)
+        return {}
+
+    runtime = make_device_runtime(poll_interval=0.05)
+    runtime.client.get_device_state.side_effect = slow_state
+    executor = Executor(make_registry(runtime), connect=False, jitter_max=0.0)
+    run_task = asyncio.create_task(executor.run())
+    await asyncio.sleep(0.33)
+    await executor.stop()
+    await run_task
+
+    # Interval measured from poll end would space starts ~80ms apart.
+    assert len(starts) >= 5
+    gaps = [b - a for a, b in pairwise(starts)]
+    assert sum(gaps) / len(gaps) < 0.065
+
+
+def test_metrics_are_slotted():
+    from power_sdk.runtime.loop import DeviceMetrics
+
+    m = DeviceMetrics(device_id="dev1")
+    assert not hasattr(m, "__dict__")
+    with pytest.raises(AttributeError):
+        m.poll_okk = 1  # type: ignore[attr-defined]
+
+
+def test_metrics_track_duration_ema():
+    from power_sdk.runtime.device import DeviceSnapshot
+    from power_sdk.runtime.loop import DeviceMetrics
+
+    m = DeviceMetrics(device_id="dev1")
+    for duration in (100.0, 200.0):
+        m.record(
+            DeviceSnapshot(
+                device_id="dev1",
+                model="M",
+                timestamp=0.0,
+                state={},
+                blocks_read=1,
+                duration_ms=duration,
+            )
+        )
+    assert m.duration_ema_ms == pytest.approx(120.0)  # seeded, then alpha 0.2
+
+
+@pytest.mark.parametrize("adaptive", [False, True])
+@pytest.mark.asyncio
+async def test_adaptive_interval_backs_off_slow_device(adaptive: bool):
+    from power_sdk.runtime.device import DeviceRuntime, DeviceSnapshot
+
+    class SlowRuntime(DeviceRuntime):
+        async def poll_once_async(
+            self, connect: bool = False, disconnect: bool = False
+        ) -> DeviceSnapshot:
+            # Reports 40ms per poll against a 10ms interval
+            return DeviceSnapshot(
+                device_id=self.device_id,
+                model="M",
+                timestamp=0.0,
+                state={},
+                blocks_read=1,
+                duration_ms=40.0,
+            )
+
+    base = make_device_runtime(poll_interval=0.01)
+    runtime = SlowRuntime(
+        device_id="dev1",
+        client=base.client,
+        vendor="acme",
+        protocol="v1",
+        profile_id="DEV1",
+        transport_key="stub",
+        poll_interval=0.01,
+    )
+    executor = Executor(
+        make_registry(runtime),
+        connect=False,
+        jitter_max=0.0,
+        adaptive_interval=adaptive,
+    )
+    run_task = asyncio.create_task(executor.run())
+    await asyncio.sleep(0.2)
+    await executor.stop()
+    await run_task
+
+    m = executor.metrics("dev1")
+    assert m is not None
+    if adaptive:
+        assert m.poll_ok <= 7  # stretched to the 40ms cap
+    else:
+        assert m.poll_ok >= 12
+
+
+@pytest.mark.asyncio
+async def test_poll_overrun_warns_once_per_overrun_streak(caplog):
+    import logging
+    import time
+
+    runtime = make_device_runtime(poll_interval=0.01)
+    runtime.client.get_device_state.side_effect = lambda: time.sleep(0.03) or {}
+    executor = Executor(make_registry(runtime), connect=False, jitter_max=0.0)
+    with caplog.at_level(logging.DEBUG, logger="power_sdk.runtime.loop"):
+        run_task = asyncio.create_task(executor.run())
+        await asyncio.sleep(0.2)
+        await executor.stop()
+        await run_task
+
+    overruns = [r for r in caplog.records if "overran" in r.getMessage()]
+    assert [r.levelno for r in overruns].count(logging.WARNING) == 1
+    assert len(overruns) > 1  # later overruns still logged, at DEBUG
+
+
+@pytest.mark.parametrize(("jitter", "factor"), [(0.0, 1.0), (0.5, 1.5)])
+@pytest.mark.asyncio
+async def test_interval_jitter_scales_schedule_steps(jitter: float, factor: float):
+    import time
+    from itertools import pairwise
+    from unittest.mock import patch
+
+    starts: list[float] = []
+    runtime = make_device_runtime(poll_interval=0.02)
+    runtime.client.get_device_state.side_effect = lambda: (
+        starts.append(time.monotonic()) or {}
+    )
+    executor = Executor(
+        make_registry(runtime), connect=False, jitter_max=0.0, interval_jitter=jitter
+    )
+    # Always draw the upper bound so the effect is deterministic
+    with patch("power_sdk.runtime.loop.random.uniform", side_effect=lambda lo, hi: hi):
+        run_task = asyncio.create_task(executor.run())
+        await asyncio.sleep(0.25)
+        await executor.stop()
+        await run_task
+
+    gaps = [b - a for a, b in pairwise(starts)]
+    assert len(gaps) >= 4
+    assert sum(gaps) / len(gaps) == pytest.approx(0.02 * factor, rel=0.25)
+
+
+def test_interval_jitter_must_be_a_fraction():
+    with pytest.raises(ValueError, match="interval_jitter"):
+        Executor(make_registry(make_device_runtime()), interval_jitter=1.0)
+
+
+@pytest.mark.asyncio
+async def test_async_native_runtime_is_awaited_without_thread_hop():
+    import threading
+
+    from power_sdk.runtime.device import DeviceRuntime, DeviceSnapshot
+
+    calls: list[tuple[bool, bool, str]] = []
+
+    class AsyncRuntime(DeviceRuntime):
+        async def poll_once_async(
+            self, connect: bool = False, disconnect: bool = False
+        ) -> DeviceSnapshot:
+            calls.append((connect, disconnect, threading.current_thread().name))
+            return DeviceSnapshot(
+                device_id=self.device_id,
+                model="M",
+                timestamp=0.0,
+                state={},
+                blocks_read=1,
+            )
+
+    base = make_device_runtime(poll_interval=0.01)
+    runtime = AsyncRuntime(
+        device_id="dev1",
+        client=base.client,
+        vendor="acme",
+        protocol="v1",
+        profile_id="DEV1",
+        transport_key="stub",
+        poll_interval=0.01,
+    )
+    executor = Executor(make_registry(runtime), connect=True, jitter_max=0.0)
+    run_task = asyncio.create_task(executor.run())
+    await asyncio.sleep(0.04)
+    await executor.stop()
+    await run_task
+
+    assert len(calls) >= 2
+    assert calls[0][:2] == (True, False)
+    assert all(c[:2] == (False, False) for c in calls[1:])
+    assert {c[2] for c in calls} == {threading.main_thread().name}
+    base.client.read_group.assert_not_called()
+    assert executor.metrics("dev1").poll_ok == len(calls)
+
+
 @pytest.mark.asyncio
 async def test_device_metrics_updated_on_error():
     from power_sdk.errors import TransportError
@@ -186,6 +513,242 @@ async def test_sink_worker_drains_queue_before_exit():
     assert len(sink.received) >= 2
 
 
+@pytest.mark.asyncio
+async def test_sink_worker_writes_queued_items_then_exits_on_close():
+    from power_sdk.runtime.device import DeviceSnapshot
+    from power_sdk.runtime.loop import DeviceMetrics, _sink_worker
+    from power_sdk.runtime.sink import MemorySink
+
+    metrics = DeviceMetrics(device_id="dev1")
+    q = SnapshotChannel(metrics)
+    for n in range(3):
+        q.put(
+            DeviceSnapshot(
+                device_id="dev1",
+                model="M",
+                timestamp=float(n),
+                state={},
+                blocks_read=0,
+            )
+        )
+    q.close()
+    sink = MemorySink()
+
+    await asyncio.wait_for(_sink_worker("dev1", [q], sink), timeout=1.0)
+
+    assert [s.timestamp for s in sink.history("dev1")] == [0.0, 1.0, 2.0]
+    assert len(q) == 0
+
+
+@pytest.mark.asyncio
+async def test_idle_sink_worker_schedules_no_timers():
+    from unittest.mock import patch
+
+    from power_sdk.runtime.loop import DeviceMetrics, _sink_worker
+    from power_sdk.runtime.sink import MemorySink
+
+    q = SnapshotChannel(DeviceMetrics(device_id="dev1"))
+    loop = asyncio.get_running_loop()
+    task = asyncio.create_task(_sink_worker("dev1", [q], MemorySink()))
+    await asyncio.sleep(0)
+    with patch.object(loop, "call_at", wraps=loop.call_at) as call_at:
+        await asyncio.sleep(0.1)
+    assert call_at.call_count == 1  # only this test's own sleep
+    assert not task.done()
+
+    q.close()
+    await asyncio.wait_for(task, timeout=1.0)
+
+
+@pytest.mark.asyncio
+async def test_sink_worker_hands_ready_snapshots_to_write_many():
+    from power_sdk.runtime.device import DeviceSnapshot
+    from power_sdk.runtime.loop import DeviceMetrics, _sink_worker
+
+    class BatchSink:
+        def __init__(self) -> None:
+            self.batches: list[list[float]] = []
+
+        async def write(self, snapshot) -> None:
+            raise AssertionError("write() must not be used when write_many exists")
+
+        async def write_many(self, snapshots) -> None:
+            self.batches.append([s.timestamp for s in snapshots])
+
+        async def close(self) -> None:
+            pass
+
+    metrics = DeviceMetrics(device_id="dev1")
+    q = SnapshotChannel(metrics)
+    for n in range(70):
+        q.put(
+            DeviceSnapshot(
+                device_id="dev1",
+                model="M",
+                timestamp=float(n),
+                state={},
+                blocks_read=0,
+            )
+        )
+    q.close()
+    sink = BatchSink()
+
+    await asyncio.wait_for(_sink_worker("dev1", [q], sink), timeout=1.0)
+
+    assert [len(b) for b in sink.batches] == [64, 6]
+    assert [t for b in sink.batches for t in b] == [float(n) for n in range(70)]
+
+
+@pytest.mark.asyncio
+async def test_crashed_producer_sink_worker_drains_and_exits():
+    from unittest.mock import patch
+
+    runtime = make_device_runtime(poll_interval=0.01)
+    executor = Executor(make_registry(runtime), connect=False, jitter_max=0.0)
+    with patch(
+        "power_sdk.runtime.loop.DeviceMetrics.record",
+        side_effect=RuntimeError("boom"),
+    ):
+        await asyncio.wait_for(executor.run(), timeout=2.0)
+
+    assert all(t.done() and not t.cancelled() for t in executor._sink_tasks)
+
+
+@pytest.mark.asyncio
+async def test_devices_sharing_a_sink_share_one_worker():
+    from power_sdk.runtime.registry import RuntimeRegistry
+    from power_sdk.runtime.sink import MemorySink
+
+    shared, own = MemorySink(), MemorySink()
+    runtimes = [
+        make_device_runtime(device_id=d, poll_interval=0.01)
+        for d in ("dev1", "dev2", "dev3")
+    ]
+    registry = RuntimeRegistry(
+        runtimes, device_sinks={"dev1": shared, "dev2": shared, "dev3": own}
+    )
+    executor = Executor(registry, connect=False, jitter_max=0.0)
+
+    run_task = asyncio.create_task(executor.run())
+    await asyncio.sleep(0.05)
+    assert sorted(t.get_name() for t in executor._sink_tasks) == [
+        "sink-worker-dev1,dev2",
+        "sink-worker-dev3",
+    ]
+    await executor.stop(timeout=2.0)
+    await run_task
+
+    assert shared.history("dev1") and shared.history("dev2")
+    assert not shared.history("dev3")
+    assert own.history("dev3")
+
+
+@pytest.mark.asyncio
+async def test_shared_sink_closed_once():
+    from power_sdk.runtime.registry import RuntimeRegistry
+
+    class CountingSink:
+        def __init__(self) -> None:
+            self.closed = 0
+
+        async def write(self, snapshot) -> None:
+            pass
+
+        async def close(self) -> None:
+            self.closed += 1
+
+    sink = CountingSink()
+    runtimes = [
+        make_device_runtime(device_id=d, poll_interval=0.01) for d in ("dev1", "dev2")
+    ]
+    registry = RuntimeRegistry(runtimes, device_sinks={"dev1": sink, "dev2": sink})
+    executor = Executor(registry, connect=False, jitter_max=0.0)
+    run_task = asyncio.create_task(executor.run())
+    await asyncio.sleep(0.02)
+    await executor.stop(timeout=2.0)
+    await run_task
+
+    assert sink.closed == 1
+
+
+@pytest.mark.asyncio
+async def test_no_sink_skips_worker_but_records_metrics():
+    runtime = make_device_runtime(poll_interval=0.01)
+    executor = Executor(make_registry(runtime), connect=False, jitter_max=0.0)
+
+    run_task = asyncio.create_task(executor.run())
+    await asyncio.sleep(0.05)
+    assert executor._sink_tasks == []
+    assert len(executor._queues["dev1"]) == 0
+    await executor.stop(timeout=2.0)
+    await run_task
+
+    m = executor.metrics("dev1")
+    assert m is not None
+    assert m.poll_ok >= 2
+    assert m.dropped_snapshots == 0
+
+
+@pytest.mark.asyncio
+async def test_sink_worker_drains_every_channel_then_exits():
+    from power_sdk.runtime.device import DeviceSnapshot
+    from power_sdk.runtime.loop import DeviceMetrics, _sink_worker
+    from power_sdk.runtime.sink import MemorySink
+
+    ready = asyncio.Event()
+    channels = {
+        d: SnapshotChannel(DeviceMetrics(device_id=d), ready=ready)
+        for d in ("dev1", "dev2")
+    }
+    sink = MemorySink()
+    task = asyncio.create_task(_sink_worker("dev1,dev2", list(channels.values()), sink))
+    await asyncio.sleep(0)
+
+    for n in range(3):
+        for device_id, channel in channels.items():
+            channel.put(
+                DeviceSnapshot(
+                    device_id=device_id,
+                    model="M",
+                    timestamp=float(n),
+                    state={},
+                    blocks_read=0,
+                )
+            )
+    channels["dev1"].close()
+    await asyncio.sleep(0.01)
+    assert not task.done()  # dev2 is still open
+    channels["dev2"].close()
+    await asyncio.wait_for(task, timeout=1.0)
+
+    for device_id in channels:
+        assert [s.timestamp for s in sink.history(device_id)] == [0.0, 1.0, 2.0]
+
+
+@pytest.mark.asyncio
+async def test_device_loop_crash_logged_while_others_keep_running(caplog):
+    import logging
+    from unittest.mock import MagicMock
+
+    healthy = make_device_runtime(device_id="dev1", poll_interval=0.01)
+    broken = make_device_runtime(device_id="dev2", poll_interval=0.01)
+    broken.poll_once = MagicMock(side_effect=RuntimeError("boom"))  # type: ignore[method-assign]
+    executor = Executor(make_registry(healthy, broken), connect=False, jitter_max=0.0)
+
+    with caplog.at_level(logging.ERROR, logger="power_sdk.runtime.loop"):
+        run_task = asyncio.create_task(executor.run())
+        await asyncio.sleep(0.05)
+        # Reported before shutdown, not only once run() returns
+        assert "Device loop for 'dev2' raised unexpected exception" in caplog.text
+        before = executor.metrics("dev1").poll_ok  # type: ignore[union-attr]
+        await asyncio.sleep(0.03)
+        assert executor.metrics("dev1").poll_ok > before  # type: ignore[union-attr]
+        await executor.stop(timeout=2.0)
+        await run_task
+
+    assert caplog.text.count("Device loop for 'dev2'") == 1
+
+
 @pytest.mark.asyncio
 async def test_reconnect_failure_does_not_crash_loop():
     """If disconnect/connect raises during reconnect, the loop continues."""
@@ -323,7 +886,7 @@ async def test_sink_drain_cancelled_error_is_reraised():
     a slow `sink.write()` call — CancelledError must propagate out unchanged.
     """
     from power_sdk.runtime.device import DeviceSnapshot
-    from power_sdk.runtime.loop import _sink_worker
+    from power_sdk.runtime.loop import DeviceMetrics, _sink_worker
 
     class SlowSink:
         """Sink whose write() blocks long enough to receive a cancellation."""
@@ -334,17 +897,17 @@ async def test_sink_drain_cancelled_error_is_reraised():
         async def close(self) -> None:
             pass
 
-    q: asyncio.Queue = asyncio.Queue()
-    stop_event = asyncio.Event()
+    metrics = DeviceMetrics(device_id="dev1")
+    q = SnapshotChannel(metrics)
 
     snapshot = DeviceSnapshot(
         device_id="dev1", model="M", timestamp=0.0, state={}, blocks_read=0
     )
-    q.put_nowait(snapshot)
-    # stop_event NOT set yet — outer while runs and calls sink.write(snapshot)
+    q.put(snapshot)
+    q.put(snapshot)  # still queued when cancelled
 
     sink = SlowSink()
-    task = asyncio.create_task(_sink_worker("dev1", q, sink, stop_event))
+    task = asyncio.create_task(_sink_worker("dev1", [q], sink))
 
     # Let the task enter sink.write() (which sleeps 0.2s), then cancel it.
     await asyncio.sleep(0.05)
@@ -361,7 +924,7 @@ async def test_sink_drain_cancelled_error_is_reraised():
 async def test_poll_once_timeout_produces_error_snapshot():
     """When poll_once hangs beyond poll_timeout, an error snapshot is produced.
 
-    asyncio.to_thread() cannot be cancelled mid-execution; wait_for() is used
+    Executor jobs cannot be cancelled mid-execution; wait_for() is used
     to impose a deadline.  The resulting snapshot must have ok=False and an
     error message describing the timeout.
 
@@ -375,9 +938,9 @@ async def test_poll_once_timeout_produces_error_snapshot():
 
     runtime = make_device_runtime(poll_interval=0.01)
 
-    q: asyncio.Queue = asyncio.Queue(maxsize=10)
     stop_event = asyncio.Event()
     metrics = DeviceMetrics(device_id="dev1")
+    q = SnapshotChannel(metrics, 10)
 
     original_wait_for = asyncio.wait_for
     call_count = 0
@@ -385,10 +948,10 @@ async def test_poll_once_timeout_produces_error_snapshot():
     async def _patched_wait_for(coro, timeout):
         nonlocal call_count
         call_count += 1
-        # First call is the poll_once to_thread — make it time out.
+        # First call is the poll_once executor future — make it time out.
         # Subsequent calls (interval wait, stop_event.wait) use real wait_for.
         if call_count == 1 and timeout > 1.0:
-            coro.close()  # cleanly close the coroutine/thread-wrapper
+            coro.cancel()  # drop the executor future; the mock returns at once
             raise asyncio.TimeoutError()
         return await original_wait_for(coro, timeout)
 
@@ -402,7 +965,6 @@ async def test_poll_once_timeout_produces_error_snapshot():
                 q,
                 connect=False,
                 jitter_max=0.0,
-                drop_policy="drop_oldest",
                 reconnect_after_errors=0,
                 reconnect_cooldown_s=0.0,
             )
@@ -412,8 +974,8 @@ async def test_poll_once_timeout_produces_error_snapshot():
         await loop_task
 
     # The queue must contain at least one timeout error snapshot.
-    assert not q.empty(), "Expected at least one timeout error snapshot in queue"
-    snap = q.get_nowait()
+    assert len(q), "Expected at least one timeout error snapshot in channel"
+    snap = q.drain_all()[0]
     assert not snap.ok, "Timeout snapshot must have ok=False"
     assert snap.error is not None
     assert "timed out" in str(snap.error).lower()
@@ -432,9 +994,9 @@ async def test_timeout_snapshot_uses_wall_clock_timestamp():
     from power_sdk.runtime.loop import DeviceMetrics, _device_loop
 
     runtime = make_device_runtime(poll_interval=0.01)
-    q: asyncio.Queue = asyncio.Queue(maxsize=10)
     stop_event = asyncio.Event()
     metrics = DeviceMetrics(device_id="dev1")
+    q = SnapshotChannel(metrics, 10)
 
     original_wait_for = asyncio.wait_for
     call_count = 0
@@ -443,7 +1005,7 @@ async def test_timeout_snapshot_uses_wall_clock_timestamp():
         nonlocal call_count
         call_count += 1
         if call_count == 1 and timeout > 1.0:
-            coro.close()
+            coro.cancel()
             raise asyncio.TimeoutError()
         return await original_wait_for(coro, timeout)
 
@@ -457,7 +1019,6 @@ async def test_timeout_snapshot_uses_wall_clock_timestamp():
                 q,
                 connect=False,
                 jitter_max=0.0,
-                drop_policy="drop_oldest",
                 reconnect_after_errors=0,
                 reconnect_cooldown_s=0.0,
             )
@@ -466,8 +1027,8 @@ async def test_timeout_snapshot_uses_wall_clock_timestamp():
         stop_event.set()
         await loop_task
 
-    assert not q.empty(), "Expected timeout error snapshot in queue"
-    snap = q.get_nowait()
+    assert len(q), "Expected timeout error snapshot in channel"
+    snap = q.drain_all()[0]
     # Unix timestamp is always > 1 billion; monotonic (seconds since boot) is not.
     assert snap.timestamp > 1_000_000_000, (
         f"Expected Unix wall-clock timestamp (>1e9), got {snap.timestamp!r}; "
@@ -518,3 +1079,53 @@ async def test_sink_worker_exception_is_logged_as_error(caplog):
         record.levelno == logging.ERROR and "sink" in record.message.lower()
         for record in caplog.records
     ), "Expected ERROR-level log for sink exception"
+
+
+def test_install_uvloop_sets_policy_when_available(monkeypatch):
+    import sys
+    import types
+
+    from power_sdk.runtime import install_uvloop
+
+    class FakePolicy(asyncio.DefaultEventLoopPolicy):
+        pass
+
+    monkeypatch.setitem(
+        sys.modules, "uvloop", types.SimpleNamespace(EventLoopPolicy=FakePolicy)
+    )
+    try:
+        assert install_uvloop() is True
+        assert isinstance(asyncio.get_event_loop_policy(), FakePolicy)
+    finally:
+        asyncio.set_event_loop_policy(None)
+
+
+def test_install_uvloop_without_uvloop_is_a_no_op(monkeypatch):
+    import sys
+
+    from power_sdk.runtime import install_uvloop
+
+    monkeypatch.setitem(sys.modules, "uvloop", None)  # import raises ImportError
+    policy = asyncio.get_event_loop_policy()
+    assert install_uvloop() is False
+    assert asyncio.get_event_loop_policy() is policy
+
+
+def test_uvloop_hint_only_when_installed_but_unused(monkeypatch, caplog):
+    import importlib.util
+    import logging
+
+    from power_sdk.runtime.loop import _log_uvloop_hint
+
+    loop = asyncio.new_event_loop()
+    try:
+        with caplog.at_level(logging.INFO, logger="power_sdk.runtime.loop"):
+            monkeypatch.setattr(importlib.util, "find_spec", lambda name: None)
+            _log_uvloop_hint(loop)
+            assert "uvloop" not in caplog.text
+
+            monkeypatch.setattr(importlib.util, "find_spec", lambda name: object())
+            _log_uvloop_hint(loop)
+            assert "install_uvloop()" in caplog.text
+    finally:
+        loop.close()
@@ -7,6 +7,7 @@ import time
 from unittest.mock import MagicMock, patch
 
 import pytest
+from power_sdk.runtime.channel import SnapshotChannel
 from power_sdk.runtime.device import DeviceRuntime, DeviceSnapshot
 from power_sdk.runtime.loop import DeviceMetrics, Executor, _push_loop
 from power_sdk.runtime.push import PushCallbackAdapter, _default_decode
@@ -42,18 +43,11 @@ def _make_adapter(
     maxsize: int = 10,
     drop_policy: str = "drop_oldest",
     decode_fn=None,
-) -> tuple[PushCallbackAdapter, asyncio.Queue, DeviceMetrics]:
+) -> tuple[PushCallbackAdapter, SnapshotChannel, DeviceMetrics]:
     r = runtime or _make_runtime()
     metrics = DeviceMetrics(device_id=r.device_id)
-    queue: asyncio.Queue = asyncio.Queue(maxsize=maxsize)
-    adapter = PushCallbackAdapter(
-        r,
-        metrics,
-        queue,
-        loop,
-        decode_fn=decode_fn,
-        drop_policy=drop_policy,
-    )
+    queue = SnapshotChannel(metrics, maxsize, drop_policy)
+    adapter = PushCallbackAdapter(r, metrics, queue, loop, decode_fn=decode_fn)
     return adapter, queue, metrics
 
 
@@ -91,12 +85,90 @@ class TestPushCallbackAdapterOnData:
         adapter, queue, _ = _make_adapter(loop=asyncio.get_running_loop())
         adapter.on_data({"soc": 75})
         await asyncio.sleep(0)  # allow call_soon_threadsafe to fire
-        assert not queue.empty()
-        snap = queue.get_nowait()
+        [snap] = queue.drain_all()
         assert isinstance(snap, DeviceSnapshot)
         assert snap.state == {"soc": 75}
         assert snap.ok
 
+    @pytest.mark.asyncio
+    async def test_timestamp_follows_wall_clock_across_flushes(self) -> None:
+        adapter, queue, _ = _make_adapter(loop=asyncio.get_running_loop())
+        before = time.time()
+        adapter.on_data({"n": 0})
+        await asyncio.sleep(0)
+        with patch("power_sdk.runtime.push.time.time", return_value=before + 3600):
+            adapter.on_data({"n": 1})  # offset still anchored at construction
+            await asyncio.sleep(0)  # _flush re-anchors to the stepped clock
+        adapter.on_data({"n": 2})
+        await asyncio.sleep(0)
+
+        first, second, third = (s.timestamp for s in queue.drain_all())
+        assert before - 1.0 < first < time.time() + 1.0
+        assert second - first < 1.0
+        assert third - first > 3599.0
+
+    @pytest.mark.asyncio
+    async def test_burst_from_thread_wakes_loop_once(self) -> None:
+        import threading
+
+        loop = asyncio.get_running_loop()
+        adapter, queue, metrics = _make_adapter(loop=loop, maxsize=0)
+        with patch.object(
+            loop, "call_soon_threadsafe", wraps=loop.call_soon_threadsafe
+        ) as wakeups:
+            producer = threading.Thread(
+                target=lambda: [adapter.on_data({"n": n}) for n in range(50)]
+            )
+            producer.start()
+            producer.join()
+            await asyncio.sleep(0)
+
+            assert wakeups.call_count == 1
+            assert [s.state["n"] for s in queue.drain_all()] == list(range(50))
+            assert metrics.poll_ok == 50
+
+            adapter.on_data({"n": 50})  # idle again: next packet schedules anew
+            await asyncio.sleep(0)
+            assert wakeups.call_count == 2
+            assert len(queue) == 1
+
+    def test_closed_loop_counts_every_pending_snapshot_as_dropped(self) -> None:
+        loop = MagicMock()
+        loop.call_soon_threadsafe.side_effect = RuntimeError("Event loop is closed")
+        adapter, queue, metrics = _make_adapter(loop=loop)
+        # Queued by another transport thread, riding on a flush never scheduled
+        adapter._pending.append(
+            DeviceSnapshot(
+                device_id="dev1",
+                model="X",
+                timestamp=0.0,
+                state={"n": 0},
+                blocks_read=1,
+            )
+        )
+        adapter.on_data({"n": 1})
+        assert metrics.dropped_snapshots == 2
+        assert not adapter._pending
+        assert not adapter._flush_scheduled
+
+        adapter.on_data({"n": 2})  # next packet tries to schedule again
+        assert loop.call_soon_threadsafe.call_count == 2
+        assert metrics.dropped_snapshots == 3
+        assert len(queue) == 0
+
+    def test_flush_stranded_by_loop_close_drops_later_packets(self) -> None:
+        loop = asyncio.new_event_loop()
+        adapter, queue, metrics = _make_adapter(loop=loop)
+        adapter.on_data({"n": 0})  # flush scheduled, but the loop never runs it
+        loop.close()
+
+        for n in range(1, 1001):
+            adapter.on_data({"n": n})
+        assert metrics.dropped_snapshots == 1001
+        assert not adapter._pending
+        assert not adapter._flush_scheduled
+        assert len(queue) == 0
+
     @pytest.mark.asyncio
     async def test_on_data_uses_decode_fn(self) -> None:
         def my_decode(raw):
@@ -107,7 +179,7 @@ class TestPushCallbackAdapterOnData:
         )
         adapter.on_data(5)
         await asyncio.sleep(0)
-        snap = queue.get_nowait()
+        [snap] = queue.drain_all()
         assert snap.state == {"parsed": 10}
 
     @pytest.mark.asyncio
@@ -120,7 +192,7 @@ class TestPushCallbackAdapterOnData:
         )
         adapter.on_data(b"garbage")
         await asyncio.sleep(0)
-        snap = queue.get_nowait()
+        [snap] = queue.drain_all()
         assert not snap.ok
         assert isinstance(snap.error, ValueError)
         assert snap.state == {}
@@ -166,17 +238,15 @@ class TestPushCallbackAdapterOnData:
             state={"n": 2},
             blocks_read=1,
         )
-        queue.put_nowait(snap1)
-        queue.put_nowait(snap2)
+        queue.put(snap1)
+        queue.put(snap2)
         assert queue.full()
 
         adapter.on_data({"n": 3})
         await asyncio.sleep(0)
 
         assert metrics.dropped_snapshots == 1
-        items = []
-        while not queue.empty():
-            items.append(queue.get_nowait().state["n"])
+        items = [s.state["n"] for s in queue.drain_all()]
         # snap1 was dropped (oldest), snap2 + new are kept
         assert items == [2, 3]
 
@@ -199,16 +269,14 @@ class TestPushCallbackAdapterOnData:
             state={"n": 2},
             blocks_read=1,
         )
-        queue.put_nowait(snap1)
-        queue.put_nowait(snap2)
+        queue.put(snap1)
+        queue.put(snap2)
 
         adapter.on_data({"n": 3})
         await asyncio.sleep(0)
 
         assert metrics.dropped_snapshots == 1
-        items = []
-        while not queue.empty():
-            items.append(queue.get_nowait().state["n"])
+        items = [s.state["n"] for s in queue.drain_all()]
         assert items == [1, 2]  # new item was dropped
 
 
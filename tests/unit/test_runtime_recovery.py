@@ -160,3 +160,43 @@ async def test_no_reconnect_when_connect_false() -> None:
     m = executor.metrics("dev1")
     assert m is not None
     assert m.reconnect_attempts == 0
+
+
+@pytest.mark.asyncio
+async def test_reconnect_cooldown_backs_off_exponentially() -> None:
+    """Each failed reconnect doubles the wait before the next one (capped)."""
+    import time
+    from itertools import pairwise
+    from unittest.mock import patch
+
+    attempts: list[float] = []
+
+    def failing_connect_once() -> None:
+        attempts.append(time.monotonic())
+        raise TransportError("still offline")
+
+    runtime = make_device_runtime(poll_interval=0.005)
+    runtime.client.read_group.side_effect = TransportError("fail")
+    runtime.client.connect_once.side_effect = failing_connect_once
+
+    executor = Executor(
+        make_registry(runtime),
+        connect=True,
+        jitter_max=0.0,
+        reconnect_after_errors=1,
+        reconnect_cooldown_s=0.02,
+        reconnect_max_cooldown_s=0.16,
+    )
+    # Midpoint of uniform(): no start jitter, backoff factor exactly 1.0
+    with patch(
+        "power_sdk.runtime.loop.random.uniform", side_effect=lambda a, b: (a + b) / 2
+    ):
+        run_task = asyncio.create_task(executor.run())
+        await asyncio.sleep(0.5)
+        await executor.stop()
+        await run_task
+
+    # Cooldowns 0.04, 0.08, 0.16, 0.16 … — a fixed 20ms cooldown would fire ~25x
+    assert 3 <= len(attempts) <= 7
+    gaps = [b - a for a, b in pairwise(attempts)]
+    assert gaps[1] > gaps[0] * 1.5
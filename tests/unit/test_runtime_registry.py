@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import pytest
-from power_sdk.runtime import DeviceSnapshot, RuntimeRegistry
+from power_sdk.runtime import DeviceRuntime, DeviceSnapshot, RuntimeRegistry
 
 from tests.helpers import make_device_runtime
 
@@ -81,6 +81,56 @@ def test_poll_all_once_error_in_one_does_not_stop_others():
     assert snapshots[2].ok
 
 
+def test_poll_all_once_polls_devices_concurrently():
+    import threading
+
+    runtimes = [make_device_runtime(f"dev{i}", poll_interval=30.0) for i in range(4)]
+    barrier = threading.Barrier(len(runtimes), timeout=5.0)
+
+    def read_group(*_args, **_kwargs):
+        barrier.wait()  # returns only once all four devices are mid-poll
+        return []
+
+    for r in runtimes:
+        r.client.read_group.side_effect = read_group
+    snapshots = RuntimeRegistry(runtimes).poll_all_once()
+    assert [s.device_id for s in snapshots] == ["dev0", "dev1", "dev2", "dev3"]
+    assert all(s.ok for s in snapshots)
+
+
+@pytest.mark.asyncio
+async def test_poll_all_once_async_mixes_native_and_blocking_polls():
+    class AsyncRuntime(DeviceRuntime):
+        async def poll_once_async(
+            self, connect: bool = False, disconnect: bool = False
+        ) -> DeviceSnapshot:
+            return DeviceSnapshot(
+                device_id=self.device_id,
+                model="M",
+                timestamp=0.0,
+                state={"native": connect},
+                blocks_read=1,
+            )
+
+    native = AsyncRuntime(
+        device_id="dev1",
+        client=make_device_runtime().client,
+        vendor="acme",
+        protocol="v1",
+        profile_id="DEV1",
+        transport_key="stub",
+        poll_interval=30.0,
+    )
+    blocking = make_device_runtime("dev2", poll_interval=30.0)
+    snapshots = await RuntimeRegistry([native, blocking]).poll_all_once_async(
+        connect=True
+    )
+    assert [s.device_id for s in snapshots] == ["dev1", "dev2"]
+    assert snapshots[0].state == {"native": True}
+    native.client.read_group.assert_not_called()
+    blocking.client.connect.assert_called_once()
+
+
 def test_dry_run_returns_device_summaries():
     from power_sdk.plugins.registry import PluginRegistry
 
@@ -101,6 +151,26 @@ def test_dry_run_returns_device_summaries():
     assert summaries[0].supports_streaming is True
 
 
+def test_dry_run_discovers_plugins_once_per_instance(monkeypatch):
+    from power_sdk.plugins.registry import PluginRegistry
+
+    from tests.stubs.acme.plugin import ACME_V1_MANIFEST
+
+    plugin_reg = PluginRegistry()
+    plugin_reg.register(ACME_V1_MANIFEST)
+    calls = []
+
+    def fake_load_plugins():
+        calls.append(1)
+        return plugin_reg
+
+    monkeypatch.setattr("power_sdk.runtime.registry.load_plugins", fake_load_plugins)
+    reg = RuntimeRegistry([make_device_runtime("dev1", poll_interval=30.0)])
+    assert reg.dry_run()[0].supports_streaming is True
+    assert reg.dry_run()[0].supports_streaming is True
+    assert len(calls) == 1
+
+
 def test_dry_run_unknown_manifest_falls_back_to_safe_defaults():
     from power_sdk.plugins.registry import PluginRegistry
 
@@ -168,3 +238,81 @@ def test_from_config_rejects_invalid_defaults_transport_type(tmp_path, monkeypat
 
     with pytest.raises(ValueError, match=r"defaults\.transport"):
         RuntimeRegistry.from_config(str(yaml_path), plugin_registry=PluginRegistry())
+
+
+def test_poll_once_state_is_read_only_view():
+    runtime = make_device_runtime()
+    runtime.client.get_device_state.return_value = {"soc": 80}
+    snap = runtime.poll_once()
+    assert snap.state == {"soc": 80}
+    with pytest.raises(TypeError):
+        snap.state["soc"] = 0  # type: ignore[index]
+
+
+def test_device_snapshot_is_slotted():
+    snap = DeviceSnapshot(
+        device_id="dev1", model="M", timestamp=0.0, state={}, blocks_read=0
+    )
+    assert not hasattr(snap, "__dict__")
+    assert snap.ok
+
+
+def test_device_summary_is_slotted_and_frozen():
+    import dataclasses
+
+    from power_sdk.runtime import DeviceSummary
+
+    summary = DeviceSummary(
+        device_id="dev1",
+        vendor="acme",
+        protocol="v1",
+        profile_id="DEV1",
+        transport_key="stub",
+        poll_interval=30.0,
+        can_write=False,
+        supports_streaming=True,
+    )
+    assert not hasattr(summary, "__dict__")
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        summary.mode = "push"  # type: ignore[misc]
+    assert hash(summary) == hash(dataclasses.replace(summary))
+
+
+def test_device_runtime_model_resolved_once_at_construction():
+    runtime = make_device_runtime()
+    assert runtime.model == "M"
+    runtime.client.profile.model = "CHANGED"
+    assert runtime.poll_once().model == "M"
+
+
+def test_device_runtime_unreadable_profile_falls_back_to_unknown():
+    from unittest.mock import Mock, PropertyMock
+
+    client = Mock()
+    type(client).profile = PropertyMock(side_effect=RuntimeError("no profile"))
+    client.read_group = Mock(return_value=[])
+    client.get_device_state = Mock(return_value={})
+    runtime = DeviceRuntime(
+        device_id="dev1",
+        client=client,
+        vendor="acme",
+        protocol="v1",
+        profile_id="DEV1",
+        transport_key="stub",
+    )
+    assert runtime.poll_once().model == "unknown"
+
+
+def test_poll_groups_match_value_or_name_case_insensitively():
+    from power_sdk.models.types import BlockGroup
+    from power_sdk.runtime.registry import _resolve_poll_groups
+
+    entry = {"poll_groups": ["core", "GRID", "Battery"]}
+    assert _resolve_poll_groups(entry, {}) == (
+        BlockGroup.CORE,
+        BlockGroup.GRID,
+        BlockGroup.BATTERY,
+    )
+    assert _resolve_poll_groups({}, {}) == (BlockGroup.CORE,)
+    with pytest.raises(ValueError, match="Unknown poll_group 'solar'"):
+        _resolve_poll_groups({"poll_groups": ["solar"]}, {})
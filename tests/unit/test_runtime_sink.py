@@ -60,6 +60,26 @@ async def test_memory_sink_ok_error_counts():
     assert sink.error_count("dev1") == 1
 
 
+@pytest.mark.asyncio
+async def test_memory_sink_counts_track_evictions():
+    sink = MemorySink(maxlen=3)
+    pattern = [False, True, False, True, True, False, True]
+    await sink.write_many([_make_snapshot(ok=ok) for ok in pattern])
+    # Only the last three are retained: True, False, True
+    assert sink.ok_count("dev1") == 2
+    assert sink.error_count("dev1") == 1
+    for _ in range(3):
+        await sink.write(_make_snapshot(ok=True))
+    assert sink.ok_count("dev1") == 3
+    assert sink.error_count("dev1") == 0
+    assert sink.ok_count("unknown") == sink.error_count("unknown") == 0
+
+    empty = MemorySink(maxlen=0)
+    await empty.write(_make_snapshot(ok=False))
+    assert empty.error_count("dev1") == 0
+    assert empty.last("dev1") is None
+
+
 @pytest.mark.asyncio
 async def test_memory_sink_all_last():
     sink = MemorySink()
@@ -154,3 +174,187 @@ async def test_composite_sink_close_attempts_all():
     with pytest.raises(RuntimeError):
         await sink.close()
     assert calls == ["A", "B"]
+
+
+@pytest.mark.asyncio
+async def test_jsonl_sink_write_many_appends_in_order(tmp_path):
+    path = tmp_path / "batch.jsonl"
+    sink = JsonlSink(path)
+    await sink.write_many([_make_snapshot("d1"), _make_snapshot("d2", ok=False)])
+    await sink.write_many([])
+    objs = [json.loads(line) for line in path.read_text().splitlines()]
+    assert [o["device_id"] for o in objs] == ["d1", "d2"]
+    assert [o["ok"] for o in objs] == [True, False]
+
+
+@pytest.mark.asyncio
+async def test_jsonl_sink_writes_utf8_and_stringifies_keys(tmp_path):
+    path = tmp_path / "utf8.jsonl"
+    snapshot = DeviceSnapshot(
+        device_id="dev1",
+        model="M",
+        timestamp=1.5,
+        state={"name": "Küche", 7: "slot", "wifi_password": "secret"},
+        blocks_read=1,
+    )
+    await JsonlSink(path).write(snapshot)
+    raw = path.read_bytes()
+    assert raw.endswith(b"}\n") and raw.count(b"\n") == 1
+    assert "Küche".encode() in raw  # not \u-escaped
+    assert json.loads(raw)["state"] == {
+        "name": "Küche",
+        "7": "slot",
+        "wifi_password": "<redacted>",
+    }
+
+
+@pytest.mark.asyncio
+async def test_jsonl_sink_encodes_off_the_event_loop_thread(tmp_path, monkeypatch):
+    import threading
+
+    encoded_on: set[str] = set()
+    original = JsonlSink._format
+
+    def tracking_format(snapshot: DeviceSnapshot) -> bytes:
+        encoded_on.add(threading.current_thread().name)
+        return original(snapshot)
+
+    monkeypatch.setattr(JsonlSink, "_format", staticmethod(tracking_format))
+    sink = JsonlSink(tmp_path / "off_loop.jsonl")
+    await sink.write(_make_snapshot("d1"))
+    await sink.write_many([_make_snapshot("d2")])
+
+    assert encoded_on
+    assert threading.current_thread().name not in encoded_on
+    assert len((tmp_path / "off_loop.jsonl").read_text().splitlines()) == 2
+
+
+@pytest.mark.asyncio
+async def test_composite_sink_write_many_uses_batch_or_falls_back():
+    class WriteOnlySink:
+        def __init__(self) -> None:
+            self.received: list[DeviceSnapshot] = []
+
+        async def write(self, snapshot: DeviceSnapshot) -> None:
+            self.received.append(snapshot)
+            if len(self.received) == 1:
+                raise RuntimeError("first write fails")
+
+        async def close(self) -> None:
+            pass
+
+    mem = MemorySink()
+    plain = WriteOnlySink()
+    batch = [_make_snapshot(), _make_snapshot()]
+    sink = CompositeSink(mem, plain)
+
+    with pytest.raises(RuntimeError, match=r"write_many failed in 1 sink\(s\)"):
+        await sink.write_many(batch)
+    assert mem.history("dev1") == batch
+    assert plain.received == batch
+
+
+@pytest.mark.asyncio
+async def test_composite_sink_writes_to_sinks_concurrently():
+    started: list[str] = []
+    release = asyncio.Event()
+
+    class GatedSink:
+        def __init__(self, name: str) -> None:
+            self.name = name
+
+        async def write(self, snapshot: DeviceSnapshot) -> None:
+            started.append(self.name)
+            await release.wait()
+            raise ValueError(self.name)
+
+        async def close(self) -> None:
+            pass
+
+    sink = CompositeSink(GatedSink("A"), GatedSink("B"))
+    task = asyncio.create_task(sink.write(_make_snapshot()))
+    await asyncio.sleep(0.01)
+    assert started == ["A", "B"]  # B started while A was still pending
+    release.set()
+    with pytest.raises(RuntimeError, match=r"failed in 2 sink\(s\)") as info:
+        await task
+    assert str(info.value.__cause__) == "A"
+
+
+@pytest.mark.asyncio
+async def test_jsonl_sink_write_many_keeps_encodable_snapshots(tmp_path):
+    path = tmp_path / "partial.jsonl"
+    bad = DeviceSnapshot(
+        device_id="bad",
+        model="M",
+        timestamp=0.0,
+        state={"raw": object()},
+        blocks_read=1,
+    )
+    batch = [_make_snapshot("d1"), bad, _make_snapshot("d2")]
+    with pytest.raises(RuntimeError, match=r"could not encode 1 snapshot\(s\): bad"):
+        await JsonlSink(path).write_many(batch)
+    objs = [json.loads(line) for line in path.read_text().splitlines()]
+    assert [o["device_id"] for o in objs] == ["d1", "d2"]
+
+
+def _line_encoders() -> list:
+    from power_sdk.runtime import sink as sink_mod
+
+    encoders = [pytest.param(sink_mod._encode_line_json, id="json")]
+    orjson_encoder = getattr(sink_mod, "_encode_line_orjson", None)
+    encoders.append(
+        pytest.param(
+            orjson_encoder,
+            id="orjson",
+            marks=pytest.mark.skipif(
+                orjson_encoder is None, reason="orjson not installed"
+            ),
+        )
+    )
+    return encoders
+
+
+@pytest.mark.parametrize("encode", _line_encoders())
+def test_encode_line_backends_agree_on_non_json_values(encode):
+    import dataclasses
+    import datetime
+    import enum
+    import uuid
+
+    @dataclasses.dataclass
+    class Reading:
+        volts: float
+        at: datetime.date
+
+    class Mode(enum.Enum):
+        ECO = "eco"
+
+    record = {
+        "nan": float("nan"),
+        "inf": [float("inf"), 1.5],
+        "when": datetime.datetime(2026, 1, 2, 3, 4, 5, 600000),
+        "id": uuid.UUID("12345678-1234-5678-1234-567812345678"),
+        "reading": Reading(volts=12.5, at=datetime.date(2026, 1, 2)),
+        "mode": Mode.ECO,
+    }
+    line = encode(record)
+    assert line.endswith(b"\n")
+    assert json.loads(line) == {
+        "nan": None,
+        "inf": [None, 1.5],
+        "when": "2026-01-02T03:04:05.600000",
+        "id": "12345678-1234-5678-1234-567812345678",
+        "reading": {"volts": 12.5, "at": "2026-01-02"},
+        "mode": "eco",
+    }
+    with pytest.raises(TypeError):
+        encode({"bad": object()})
+
+
+@pytest.mark.parametrize("encode", _line_encoders())
+def test_encode_line_backends_agree_on_numpy_values(encode):
+    np = pytest.importorskip("numpy")
+
+    line = encode({"a": np.array([1, 2]), "n": np.int64(3), "f": np.float32(0.5)})
+    assert json.loads(line) == {"a": [1, 2], "n": 3, "f": 0.5}
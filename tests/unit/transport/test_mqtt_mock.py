@@ -4,6 +4,7 @@ These tests use mocks to test MQTT transport without real broker connection.
 Covers thread-safety, timeout handling, and response validation.
 """
 
+import tempfile
 import time
 from contextlib import suppress
 from unittest.mock import MagicMock, Mock, patch
@@ -812,7 +813,7 @@ class TestMQTTSecurityFixes:
         assert "broker.example.com" in r
         assert "DEV001" in r
 
-    def test_pfx_ca_chain_loaded_into_ssl_context(self, tmp_path):
+    def test_pfx_ca_chain_loaded_into_ssl_context(self, tmp_path, monkeypatch):
         """CA certs from PFX bundle must be loaded into the SSL context.
 
         Without this fix, ssl.create_default_context() only trusts system CAs,
@@ -847,6 +848,7 @@ class TestMQTTSecurityFixes:
             cert_password="password",
         )
         transport = MQTTTransport(config)
+        monkeypatch.setattr(tempfile, "tempdir", str(tmp_path))
 
         mock_ssl_ctx = MagicMock()
 
@@ -869,8 +871,10 @@ class TestMQTTSecurityFixes:
         )
         # The client cert/key must still be loaded.
         mock_ssl_ctx.load_cert_chain.assert_called_once()
+        assert transport._temp_cert_dir.startswith(str(tmp_path))
+        transport._cleanup_certs()
 
-    def test_pfx_no_ca_certs_skips_load_verify_locations(self, tmp_path):
+    def test_pfx_no_ca_certs_skips_load_verify_locations(self, tmp_path, monkeypatch):
         """When PFX has no CA certs, load_verify_locations must NOT be called."""
         from unittest.mock import MagicMock, patch
 
@@ -892,6 +896,7 @@ class TestMQTTSecurityFixes:
             cert_password="password",
         )
         transport = MQTTTransport(config)
+        monkeypatch.setattr(tempfile, "tempdir", str(tmp_path))
 
         mock_ssl_ctx = MagicMock()
 
@@ -907,3 +912,4 @@ class TestMQTTSecurityFixes:
 
         mock_ssl_ctx.load_verify_locations.assert_not_called()
         mock_ssl_ctx.load_cert_chain.assert_called_once()
+        transport._cleanup_certs()